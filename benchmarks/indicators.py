@@ -0,0 +1,149 @@
+########################
+# Indicator benchmarks #
+########################
+
+# Wall time and peak memory of the indicator engine on synthetic prices, from a single series of
+# 1e3 to 1e7 bars to panels of 10 to 5,000 symbols, optionally checked against a stored baseline.
+#
+#   python -m benchmarks.indicators                          run everything and print a table
+#   python -m benchmarks.indicators --quick --save base.json  store a baseline
+#   python -m benchmarks.indicators --baseline base.json      flag regressions, exits 1 if any
+
+# import libraries
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from dashboard import indicators
+
+SERIES_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+PANEL_SYMBOLS = (10, 100, 1_000, 5_000)
+# three years of daily bars
+PANEL_DATES = 750
+QUICK_SERIES_SIZES = (1_000, 10_000, 100_000)
+QUICK_PANEL_SYMBOLS = (10, 100)
+
+
+# geometric random walk with a minute index, a Series for one symbol and a dates x symbols frame for a panel
+def synthetic_close(dates: int, symbols: int = None, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    shape = (dates,) if symbols is None else (dates, symbols)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=shape), axis=0))
+    index = pd.date_range('2000-01-01', periods=dates, freq='min')
+    if symbols is None:
+        return pd.Series(values, index=index, name='Close')
+    return pd.DataFrame(values, index=index, columns=[f'SYM{column}' for column in range(symbols)])
+
+
+# both bands the pages chart, from one instance
+def _bollinger(close):
+    bands = indicators.BollingerBands(close)
+    return bands.bollinger_hband(), bands.bollinger_lband()
+
+
+# every case takes the close and touches each output the pages use, the classes compute lazily
+CASES = {
+    'BollingerBands': _bollinger,
+    'RSIIndicator': lambda close: indicators.RSIIndicator(close).rsi(),
+    'MACD': lambda close: indicators.MACD(close).macd_diff(),
+    'TSIIndicator': lambda close: indicators.TSIIndicator(close).tsi(),
+    'ROCIndicator': lambda close: indicators.ROCIndicator(close).roc(),
+    'compute_all': lambda close: indicators.compute_all(close),
+    'dropna': lambda close: indicators.dropna(close.to_frame() if isinstance(close, pd.Series) else close),
+    '_get_min_max': lambda close: indicators._get_min_max(close, close.shift(1), 'max'),
+}
+
+
+# best wall time of a few runs and the peak traced memory of one more run
+def measure(function, close, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        function(close)
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    function(close)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_bytes': peak}
+
+
+# run every selected case on every size, results are keyed like 'RSIIndicator/series/1000'
+def run(cases, series_sizes, panel_symbols, panel_dates: int = PANEL_DATES, repeat: int = 3) -> dict:
+    inputs = [('series', size, lambda size=size: synthetic_close(size)) for size in series_sizes]
+    inputs += [('panel', symbols, lambda symbols=symbols: synthetic_close(panel_dates, symbols)) for symbols in panel_symbols]
+    results = {}
+    for kind, size, build in inputs:
+        close = build()
+        for name in cases:
+            key = f'{name}/{kind}/{size}'
+            # the biggest inputs get a single timed run
+            runs = 1 if close.size >= 1_000_000 else repeat
+            results[key] = measure(CASES[name], close, runs)
+            print(f'{key:<36} {results[key]["seconds"] * 1000:>10.2f} ms {results[key]["peak_bytes"] / 2 ** 20:>10.1f} MiB', flush=True)
+        del close
+    return results
+
+
+# cases that got slower or hungrier than the baseline by more than the tolerance
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    found = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            before = baseline[key][metric]
+            if before and result[metric] > before * (1 + tolerance):
+                found.append(f'{key} {metric}: {before:.6g} -> {result[metric]:.6g} (+{(result[metric] / before - 1) * 100:.0f}%)')
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the indicator engine on synthetic prices.')
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES), help='cases to run')
+    parser.add_argument('--sizes', nargs='+', type=int, help='series lengths, default 1e3 to 1e7')
+    parser.add_argument('--symbols', nargs='+', type=int, help='panel widths, default 10 to 5,000')
+    parser.add_argument('--panel-dates', type=int, default=PANEL_DATES, help='rows of every panel')
+    parser.add_argument('--quick', action='store_true', help='only the small sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best one counts')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare against this JSON file and exit 1 on a regression')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown or memory growth, 0.25 is 25%%')
+    args = parser.parse_args(argv)
+
+    series_sizes = args.sizes or (QUICK_SERIES_SIZES if args.quick else SERIES_SIZES)
+    panel_symbols = args.symbols or (QUICK_PANEL_SYMBOLS if args.quick else PANEL_SYMBOLS)
+    results = run(args.cases, series_sizes, panel_symbols, args.panel_dates, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump({
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+                'machine': platform.machine(),
+                'results': results,
+            }, handle, indent=2)
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)['results']
+        found = regressions(results, baseline, args.tolerance)
+        for line in found:
+            print('REGRESSION', line)
+        if found:
+            return 1
+        print(f'no regressions against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+# shared data and analytics helpers used by the dashboard pages
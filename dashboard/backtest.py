@@ -0,0 +1,162 @@
+##############
+# Backtester #
+##############
+
+# import libraries
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import optimizer, price_store, sweep
+from dashboard.indicators import SeriesOrPanel
+from dashboard.sweep import Sweep
+
+# Calendars: the closes of many symbols share one dates x symbols panel on the union of their calendars (a
+# stock's weekends next to crypto are missing bars). The indicators behind every strategy run on each symbol's
+# own trading days, like the screener, so a weekend never enters an RSI or Bollinger window; a date the symbol
+# did not trade keeps the position it had and earns nothing, the move across it is earned on the next close.
+# Results are annualized with the bars a year of the panel's calendar (optimizer.periods_per_year), about 252
+# for exchange hours alone and 365 once crypto is in it. The strategies use the sweep kernels, which give the
+# same numbers as the RSIIndicator, BollingerBands and MACD classes for a whole parameter grid in one pass.
+
+
+# closes carried forward over missing bars, from each symbol's first close to its last one
+def _fill(values: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(values)
+    listed = np.maximum.accumulate(valid, axis=0) & np.maximum.accumulate(valid[::-1], axis=0)[::-1]
+    return np.where(listed, pd.DataFrame(values).ffill().to_numpy(), np.nan)
+
+
+# Dates x symbols frame of the closes of many symbols from one grouped price store download, on the union of
+# their calendars with NaN on the dates a symbol did not trade
+def load_close(symbols, start, end) -> pd.DataFrame:
+    frames = price_store.download_many(symbols, start=start, end=end)
+    return pd.DataFrame({symbol: frame['Close'] for symbol, frame in frames.items() if not frame.empty})
+
+
+# Run a strategy on every symbol's own trading days: each column's closes are packed so they end on the last
+# row without gaps (like screener.stack), the strategy runs once over the packed panel, and its positions go
+# back to the dates they came from; a date between two closes keeps the position of the close before it
+def _own_calendar(close: SeriesOrPanel, strategy) -> Sweep:
+    panel = sweep._panel(close)
+    values = panel.to_numpy(dtype='float64')
+    valid = ~np.isnan(values)
+    counts = valid.sum(axis=0)
+    length = int(counts.max()) if values.size else 0
+    # packed row of every close, and of the last close at or before every date (-1 before the first one)
+    seen = np.cumsum(valid, axis=0)
+    rows = np.where(seen > 0, length - counts + seen - 1, -1)
+    packed = np.full((length, values.shape[1]), np.nan)
+    columns = np.broadcast_to(np.arange(values.shape[1]), values.shape)
+    packed[rows[valid], columns[valid]] = values[valid]
+    result = strategy(pd.DataFrame(packed, columns=panel.columns))
+    positions = result.values[np.maximum(rows, 0), columns]
+    positions[rows < 0] = np.nan
+    return Sweep(positions, panel.index, panel.columns, result.params)
+
+
+# Turn entry and exit signals into held positions without a loop over the bars: every bar with a signal
+# sets the position (1 on an entry, 0 on an exit, an exit wins a tie) and the last one is carried forward
+def hold(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    events = np.where(exits, 0.0, np.where(entries, 1.0, np.nan))
+    rows = np.arange(len(events)).reshape((-1,) + (1,) * (events.ndim - 1))
+    # row of the latest signal at or before every bar, -1 before the first one
+    latest = np.maximum.accumulate(np.where(np.isnan(events), -1, rows), axis=0)
+    positions = np.take_along_axis(events, np.maximum(latest, 0), axis=0)
+    return np.where(latest < 0, 0.0, positions)
+
+
+# long when the RSI drops to the oversold level, flat again once it reaches the overbought level
+def rsi_strategy(close: SeriesOrPanel, windows=(14,), low: float = 30, high: float = 70) -> Sweep:
+    def strategy(panel):
+        rsi = sweep.rsi(panel, windows)
+        with np.errstate(invalid='ignore'):
+            positions = hold(rsi.values <= low, rsi.values >= high)
+        return Sweep(positions, rsi.dates, rsi.symbols, [dict(params, low=low, high=high) for params in rsi.params])
+    return _own_calendar(close, strategy)
+
+
+# long on a close below the lower Bollinger Band, flat on a close above the upper band,
+# the band-cross binaries of bollinger_lband_indicator / bollinger_hband_indicator
+def bollinger_strategy(close: SeriesOrPanel, windows=(20,), window_devs=(2,)) -> Sweep:
+    def strategy(panel):
+        hband = sweep.bollinger(panel, windows, window_devs, output='hband')
+        lband = sweep.bollinger(panel, windows, window_devs, output='lband')
+        values = panel.to_numpy(dtype='float64')[:, :, np.newaxis]
+        with np.errstate(invalid='ignore'):
+            positions = hold(values < lband.values, values > hband.values)
+        return Sweep(positions, hband.dates, hband.symbols, hband.params)
+    return _own_calendar(close, strategy)
+
+
+# long while the MACD line is above its signal line, short (or flat) while it is below
+def macd_strategy(close: SeriesOrPanel, windows_fast=(12,), windows_slow=(26,), windows_sign=(9,), allow_short: bool = False) -> Sweep:
+    def strategy(panel):
+        diff = sweep.macd(panel, windows_fast, windows_slow, windows_sign, output='macd_diff')
+        positions = np.nan_to_num(np.sign(diff.values))
+        if not allow_short:
+            positions = np.maximum(positions, 0.0)
+        return Sweep(positions, diff.dates, diff.symbols, [dict(params, allow_short=allow_short) for params in diff.params])
+    return _own_calendar(close, strategy)
+
+
+# Bar by bar results of every symbol and parameter set, each array is dates x symbols x parameter sets
+class Backtest(NamedTuple):
+    returns: np.ndarray
+    equity: np.ndarray
+    drawdown: np.ndarray
+    turnover: np.ndarray
+    dates: pd.Index
+    symbols: pd.Index
+    params: list
+    periods_per_year: float = 252.0
+
+    # one row per symbol and parameter set
+    def summary(self) -> pd.DataFrame:
+        periods = np.maximum((~np.isnan(self.returns)).sum(axis=0), 1)
+        mean = np.nanmean(self.returns, axis=0) if len(self.returns) else np.zeros(self.returns.shape[1:])
+        std = np.nanstd(self.returns, axis=0, ddof=1) if len(self.returns) > 1 else np.full(self.returns.shape[1:], np.nan)
+        total = self.equity[-1] - 1 if len(self.equity) else np.zeros(self.returns.shape[1:])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            table = {
+                'Total Return %': total * 100,
+                'CAGR %': ((1 + total) ** (self.periods_per_year / periods) - 1) * 100,
+                'Volatility %': std * np.sqrt(self.periods_per_year) * 100,
+                'Sharpe': mean / std * np.sqrt(self.periods_per_year),
+                'Max Drawdown %': self.drawdown.min(axis=0) * 100 if len(self.drawdown) else np.zeros(self.returns.shape[1:]),
+                'Turnover / Year': self.turnover.sum(axis=0) / periods * self.periods_per_year,
+                'Trades': (self.turnover > 0).sum(axis=0),
+            }
+        labels = [','.join(f'{name}={value}' for name, value in params.items()) for params in self.params]
+        index = pd.MultiIndex.from_product([self.symbols, labels], names=['symbol', 'params'])
+        return pd.DataFrame({name: values.reshape(-1) for name, values in table.items()}, index=index)
+
+    # dates x parameter sets equity curves of one symbol
+    def equity_curves(self, symbol) -> pd.DataFrame:
+        labels = [','.join(f'{name}={value}' for name, value in params.items()) for params in self.params]
+        return pd.DataFrame(self.equity[:, self.symbols.get_loc(symbol), :], index=self.dates, columns=labels)
+
+
+# Run positions against the closes they were computed from. A position decided on a bar's close earns the
+# next bar's return, every change of position pays cost (a fraction of the traded value), and a missing
+# close earns nothing on its own bar while the move across it is earned on the next close; everything is
+# array arithmetic over all symbols and parameter sets at once. periods_per_year defaults to the bars a
+# year of the panel's own calendar.
+def run(close: SeriesOrPanel, positions: Sweep, cost: float = 0.0, periods_per_year: float = None) -> Backtest:
+    panel = sweep._panel(close)
+    if periods_per_year is None:
+        periods_per_year = optimizer.periods_per_year(panel)
+    values = _fill(panel.to_numpy(dtype='float64'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bar_returns = np.zeros_like(values)
+        bar_returns[1:] = values[1:] / values[:-1] - 1
+    bar_returns = np.nan_to_num(bar_returns, nan=0.0, posinf=0.0, neginf=0.0)[:, :, np.newaxis]
+    held = np.nan_to_num(positions.values)
+    previous = np.zeros_like(held)
+    previous[1:] = held[:-1]
+    turnover = np.abs(held - previous)
+    returns = previous * bar_returns - cost * turnover
+    equity = np.cumprod(1 + returns, axis=0)
+    drawdown = equity / np.maximum.accumulate(equity, axis=0) - 1
+    return Backtest(returns, equity, drawdown, turnover, positions.dates, positions.symbols, positions.params, periods_per_year)
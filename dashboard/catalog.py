@@ -0,0 +1,100 @@
+##################
+# Symbol catalog #
+##################
+
+# import libraries
+import bisect
+import csv
+import difflib
+import functools
+import os
+from typing import NamedTuple
+
+# the symbol universes of every page, one row per symbol with its asset class, quote currency and name; stock
+# names come from the investing.com US stock and ETF listing (as bundled with investpy), tickers that are not on
+# it (delisted symbols, preferred shares) are found and labelled by their ticker alone
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'symbols.csv')
+# most symbols a search sends back to the page
+SEARCH_LIMIT = 50
+
+
+class SymbolInfo(NamedTuple):
+    symbol: str
+    name: str
+    asset_class: str
+    currency: str
+
+
+# Symbols of every asset class with sorted keys for fast prefix search
+class Catalog:
+
+    def __init__(self, entries):
+        self._info = {}
+        self._symbols = {}
+        for entry in entries:
+            self._info.setdefault(entry.symbol, entry)
+            self._symbols.setdefault(entry.asset_class, []).append(entry.symbol)
+        self._symbols = {asset_class: tuple(symbols) for asset_class, symbols in self._symbols.items()}
+        # (search key, symbol) pairs sorted by key, per asset class and for all of them under None
+        self._keys = {}
+        for asset_class, symbols in list(self._symbols.items()) + [(None, tuple(self._info))]:
+            keys = [(symbol.upper(), symbol) for symbol in symbols]
+            keys += [(self._info[symbol].name.upper(), symbol) for symbol in symbols if self._info[symbol].name]
+            self._keys[asset_class] = sorted(keys)
+
+    # the symbols of an asset class in the order the page lists them
+    def symbols(self, asset_class: str) -> tuple:
+        return self._symbols.get(asset_class, ())
+
+    def info(self, symbol: str) -> SymbolInfo:
+        return self._info.get(symbol)
+
+    # text shown in the pickers, the symbol followed by its name when we have one
+    def label(self, symbol: str) -> str:
+        entry = self._info.get(symbol)
+        if entry is None or not entry.name:
+            return symbol
+        return f'{symbol} · {entry.name}'
+
+    # symbols whose ticker or name starts with the query, topped up with close fuzzy matches
+    def search(self, query: str, asset_class: str = None, limit: int = SEARCH_LIMIT) -> tuple:
+        query = query.strip().upper()
+        if not query:
+            return self.symbols(asset_class)[:limit] if asset_class else tuple(self._info)[:limit]
+        keys = self._keys.get(asset_class, [])
+        matches = []
+        # every key starting with the query sits in one run right after its insertion point
+        position = bisect.bisect_left(keys, (query, ''))
+        while position < len(keys) and len(matches) < limit and keys[position][0].startswith(query):
+            symbol = keys[position][1]
+            if symbol not in matches:
+                matches.append(symbol)
+            position += 1
+        if len(matches) < limit:
+            close = difflib.get_close_matches(query, [key for key, _ in keys], n=limit, cutoff=0.6)
+            lookup = dict(keys)
+            for key in close:
+                if lookup[key] not in matches and len(matches) < limit:
+                    matches.append(lookup[key])
+        return tuple(matches)
+
+
+# read the catalog file once per process
+@functools.lru_cache(maxsize=None)
+def load(path: str = CATALOG_PATH) -> Catalog:
+    with open(path, newline='') as handle:
+        return Catalog([SymbolInfo(**row) for row in csv.DictReader(handle)])
+
+
+def symbols(asset_class: str) -> tuple:
+    return load().symbols(asset_class)
+
+
+def label(symbol: str) -> str:
+    return load().label(symbol)
+
+
+# searches repeat a lot while people type, so the answers are memoized
+@functools.lru_cache(maxsize=4096)
+def search(query: str, asset_class: str = None, limit: int = SEARCH_LIMIT) -> tuple:
+    return load().search(query, asset_class, limit)
@@ -0,0 +1,130 @@
+##########################
+# Columnar history store #
+##########################
+
+# import libraries
+import datetime
+import functools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard import price_store
+
+# where the memory-mapped panels live
+COLUMNAR_DIR = os.path.join(price_store.CACHE_DIR, 'columnar')
+FIELDS = ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume')
+
+
+# file name of a field, spaces are not welcome in file names
+def _field_file(root: str, field: str) -> str:
+    return os.path.join(root, field.replace(' ', '_') + '.f8')
+
+
+# Dates x symbols panels of every OHLCV field, one float64 file per field opened with np.memmap.
+# Files are column-major so each symbol's history is contiguous, which makes a single symbol
+# a zero-copy slice and lets every worker process share the same pages of the OS page cache.
+class ColumnarStore:
+
+    def __init__(self, root: str = COLUMNAR_DIR):
+        self._root = root
+        with open(os.path.join(root, 'meta.json')) as handle:
+            meta = json.load(handle)
+        self.symbols = pd.Index(meta['symbols'])
+        self.fields = tuple(meta['fields'])
+        self.dates = pd.DatetimeIndex(np.load(os.path.join(root, 'dates.npy')))
+        self._arrays = {}
+
+    # write a store from a dict of symbol -> OHLCV frame, aligned on the union of their dates
+    @classmethod
+    def build(cls, frames: dict, root: str = COLUMNAR_DIR, fields=FIELDS) -> 'ColumnarStore':
+        os.makedirs(root, exist_ok=True)
+        symbols = [symbol for symbol, frame in frames.items() if not frame.empty]
+        dates = pd.DatetimeIndex([])
+        for symbol in symbols:
+            dates = dates.union(frames[symbol].index)
+        shape = (len(dates), len(symbols))
+        for field in fields:
+            # fill one symbol column at a time so the full panel is never held in memory
+            array = np.memmap(_field_file(root, field) + '.tmp', dtype='float64', mode='w+', shape=max(shape[0] * shape[1], 1))
+            panel = array[:shape[0] * shape[1]].reshape(shape, order='F')
+            for column, symbol in enumerate(symbols):
+                frame = frames[symbol]
+                values = frame[field] if field in frame.columns else pd.Series(np.nan, index=frame.index)
+                panel[:, column] = values.reindex(dates).to_numpy(dtype='float64')
+            array.flush()
+            del panel, array
+        np.save(os.path.join(root, 'dates.npy.tmp.npy'), dates.values.astype('datetime64[ns]'))
+        # swap the new files in, meta.json last so readers never mix old and new shapes
+        for field in fields:
+            os.replace(_field_file(root, field) + '.tmp', _field_file(root, field))
+        os.replace(os.path.join(root, 'dates.npy.tmp.npy'), os.path.join(root, 'dates.npy'))
+        with open(os.path.join(root, 'meta.json.tmp'), 'w') as handle:
+            json.dump({'symbols': symbols, 'fields': list(fields)}, handle)
+        os.replace(os.path.join(root, 'meta.json.tmp'), os.path.join(root, 'meta.json'))
+        return cls(root)
+
+    # build a store straight from the price store, downloading in grouped batches
+    @classmethod
+    def build_from_prices(cls, symbols, start, end=None, root: str = COLUMNAR_DIR, batch: int = 100) -> 'ColumnarStore':
+        end = end or datetime.date.today()
+        symbols = list(symbols)
+        frames = {}
+        for first in range(0, len(symbols), batch):
+            frames.update(price_store.download_many(symbols[first:first + batch], start, end))
+        return cls.build(frames, root)
+
+    # the read-only memory map of a field, opened once per store
+    def array(self, field: str) -> np.ndarray:
+        if field not in self._arrays:
+            shape = (len(self.dates), len(self.symbols))
+            array = np.memmap(_field_file(self._root, field), dtype='float64', mode='r', shape=max(shape[0] * shape[1], 1))
+            self._arrays[field] = array[:shape[0] * shape[1]].reshape(shape, order='F')
+        return self._arrays[field]
+
+    # row range of the dates between start (inclusive) and end (exclusive)
+    def _rows(self, start, end) -> slice:
+        first = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), side='left')
+        last = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), side='left')
+        return slice(first, last)
+
+    # dates x symbols frame of one field, a view on the memory map unless a subset of symbols is picked
+    def panel(self, field: str = 'Close', symbols=None, start=None, end=None) -> pd.DataFrame:
+        rows = self._rows(start, end)
+        values = self.array(field)[rows]
+        columns = self.symbols
+        if symbols is not None:
+            # picking columns by position has to copy them out of the map
+            positions = self.symbols.get_indexer(symbols)
+            if (positions < 0).any():
+                raise KeyError(f'not in the store: {list(pd.Index(symbols)[positions < 0])}')
+            values = values[:, positions]
+            columns = self.symbols[positions]
+        return pd.DataFrame(values, index=self.dates[rows], columns=columns, copy=False)
+
+    # one symbol's history of one field, always a zero-copy view, ready for the indicator classes
+    def series(self, symbol: str, field: str = 'Close', start=None, end=None) -> pd.Series:
+        rows = self._rows(start, end)
+        column = self.symbols.get_loc(symbol)
+        return pd.Series(self.array(field)[rows, column], index=self.dates[rows], name=field, copy=False)
+
+    # OHLCV frame of one symbol with the dates it did not trade dropped, like a price store frame
+    def frame(self, symbol: str, start=None, end=None) -> pd.DataFrame:
+        data = {field: self.series(symbol, field, start, end) for field in self.fields}
+        return pd.DataFrame(data).dropna(how='all')
+
+
+# the store under root, or None when none was built there; opened once per process and reopened
+# after a rebuild, so every screener worker keeps its maps between tasks
+def open_store(root: str = COLUMNAR_DIR):
+    meta_path = os.path.join(root, 'meta.json')
+    if not os.path.exists(meta_path):
+        return None
+    return _open(root, os.stat(meta_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _open(root: str, version: int) -> ColumnarStore:
+    return ColumnarStore(root)
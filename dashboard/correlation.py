@@ -0,0 +1,190 @@
+######################
+# Correlation engine #
+######################
+
+# import libraries
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard import price_store
+from dashboard.indicator_cache import fingerprint
+from dashboard.lru import LRUCache
+
+# symbols per block, a block pair needs a few dates x BLOCK_SIZE arrays and BLOCK_SIZE x BLOCK_SIZE products
+BLOCK_SIZE = int(os.environ.get('DASHBOARD_CORRELATION_BLOCK', 512))
+# pairs with fewer overlapping returns than this get NaN
+MIN_PERIODS = 20
+# matrices are big, so they get their own budget (DASHBOARD_CORRELATION_CACHE_MB)
+cache = LRUCache(int(float(os.environ.get('DASHBOARD_CORRELATION_CACHE_MB', 512)) * 1024 * 1024))
+
+
+# Daily returns of any mix of symbols, each computed on its own trading calendar and then aligned on the
+# union of the dates, so a stock's Monday return spans the weekend while crypto has its own weekend returns
+def returns_panel(symbols, start, end) -> pd.DataFrame:
+    frames = price_store.download_many(list(symbols), start=start, end=end)
+    returns = {}
+    for symbol, frame in frames.items():
+        if frame.empty:
+            continue
+        close = frame['Close'].dropna()
+        if close.index.tz is not None:
+            close = close.tz_localize(None)
+        # one bar a day whatever the exchange's session hours
+        close = close.groupby(close.index.normalize()).last()
+        returns[symbol] = close.pct_change()
+    return pd.DataFrame(returns).sort_index()
+
+
+# Sums over the dates where both symbols of every pair have a return, for one block of symbols against
+# another, as masked matrix products: with x zero-filled and m the 0/1 mask, x'm sums x over the
+# overlap of each pair, m'm counts it and x'x sums the cross products
+def _block_sums(x_left, m_left, x_right, m_right):
+    count = m_left.T @ m_right
+    sum_left = x_left.T @ m_right
+    sum_right = m_left.T @ x_right
+    squares_left = (x_left * x_left).T @ m_right
+    squares_right = m_left.T @ (x_right * x_right)
+    products = x_left.T @ x_right
+    return count, sum_left, sum_right, squares_left, squares_right, products
+
+
+# covariance or correlation of one block pair from its pairwise sums
+def _block_matrix(sums, method: str, min_periods: int) -> np.ndarray:
+    count, sum_left, sum_right, squares_left, squares_right, products = sums
+    with np.errstate(divide='ignore', invalid='ignore'):
+        comoment = products - sum_left * sum_right / count
+        if method == 'cov':
+            matrix = comoment / (count - 1)
+        else:
+            variance_left = squares_left - sum_left * sum_left / count
+            variance_right = squares_right - sum_right * sum_right / count
+            matrix = np.clip(comoment / np.sqrt(variance_left * variance_right), -1.0, 1.0)
+    matrix[count < max(min_periods, 2)] = np.nan
+    return matrix
+
+
+# Pairwise covariance or correlation of every column of a dates x symbols array, built one block pair at a
+# time so the pairwise intermediates never exceed block_size x block_size; only the upper triangle of
+# blocks is computed and mirrored. Matches DataFrame.cov() / DataFrame.corr() with pairwise complete dates.
+def blocked_matrix(values: np.ndarray, method: str = 'corr', min_periods: int = MIN_PERIODS, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    if method not in ('corr', 'cov'):
+        raise ValueError(f'unknown method {method!r}, expected corr or cov')
+    valid = ~np.isnan(values)
+    mask = valid.astype('float64')
+    # centre every column so the sums stay small and the products keep their precision
+    centre = np.zeros(values.shape[1])
+    has_values = valid.any(axis=0)
+    centre[has_values] = np.nanmean(values[:, has_values], axis=0)
+    centred = np.where(valid, values - centre, 0.0)
+    columns = values.shape[1]
+    matrix = np.empty((columns, columns))
+    for left in range(0, columns, block_size):
+        left_slice = slice(left, min(left + block_size, columns))
+        for right in range(left, columns, block_size):
+            right_slice = slice(right, min(right + block_size, columns))
+            sums = _block_sums(centred[:, left_slice], mask[:, left_slice], centred[:, right_slice], mask[:, right_slice])
+            block = _block_matrix(sums, method, min_periods)
+            matrix[left_slice, right_slice] = block
+            matrix[right_slice, left_slice] = block.T
+    if method == 'corr':
+        diagonal = np.arange(columns)
+        matrix[diagonal, diagonal] = np.where(np.isnan(matrix[diagonal, diagonal]), np.nan, 1.0)
+    return matrix
+
+
+# symbols x symbols covariance or correlation frame of a returns panel, cached by its content
+def matrix(returns: pd.DataFrame, method: str = 'corr', min_periods: int = MIN_PERIODS, block_size: int = BLOCK_SIZE) -> pd.DataFrame:
+    key = ('matrix', fingerprint(returns), method, min_periods)
+    result = cache.get(key)
+    if result is None:
+        values = blocked_matrix(returns.to_numpy(dtype='float64'), method, min_periods, block_size)
+        result = pd.DataFrame(values, index=returns.columns, columns=returns.columns)
+        cache.put(key, result)
+    return result
+
+
+# Rolling matrices over the last window dates, one every step dates, yielded as (end date, symbols x symbols
+# array) one window at a time. Each window goes through the blocked builder and nothing is kept, so memory
+# stays at one matrix plus the blocks being built however many windows there are; keep only what you need.
+def rolling_matrix(returns: pd.DataFrame, window: int, step: int = 1, method: str = 'corr', min_periods: int = None, block_size: int = BLOCK_SIZE):
+    min_periods = window if min_periods is None else min_periods
+    values = returns.to_numpy(dtype='float64')
+    for end in range(window, len(values) + 1, step):
+        yield returns.index[end - 1], blocked_matrix(values[end - window:end], method, min_periods, block_size)
+
+
+# Rolling correlation of one pair as a date series. The pairwise sums of the block builder slide along the
+# dates as differences of running sums, so every window costs O(1) instead of a matrix build. A window needs
+# MIN_PERIODS common returns like matrix(), a stock next to crypto never has a full window of them.
+def rolling_pair(returns: pd.DataFrame, first, second, window: int, step: int = 1, min_periods: int = None) -> pd.Series:
+    min_periods = min(window, MIN_PERIODS) if min_periods is None else min_periods
+    pair = returns[[first, second]]
+    key = ('pair', fingerprint(pair), window, step, min_periods)
+    result = cache.get(key)
+    if result is None:
+        values = pair.to_numpy(dtype='float64')
+        both = ~np.isnan(values).any(axis=1)
+        # centre on the pair's common mean so the running sums stay small
+        centre = values[both].mean(axis=0) if both.any() else np.zeros(2)
+        left, right = np.where(both[:, None], values - centre, 0.0).T
+        mask = both.astype('float64')
+        running = np.zeros((6, len(values) + 1))
+        np.cumsum([mask, left, right, left * left, right * right, left * right], axis=1, out=running[:, 1:])
+        ends = np.arange(window, len(values) + 1, step)
+        sums = tuple(running[:, ends] - running[:, ends - window])
+        result = pd.Series(_block_matrix(sums, 'corr', min_periods), index=returns.index[ends - 1], name=f'{first} / {second}')
+        cache.put(key, result)
+    return result
+
+
+# Spectral ordering and clustering of a correlation matrix, NumPy only. Symbols are nodes with
+# affinity (1 + corr) / 2; the eigenvectors of the normalized graph Laplacian with the smallest
+# eigenvalues embed them so that co-moving symbols land close together.
+def _spectral_embedding(corr: np.ndarray, dimensions: int) -> np.ndarray:
+    affinity = np.nan_to_num((1 + corr) / 2, nan=0.0)
+    np.fill_diagonal(affinity, 0.0)
+    degree = affinity.sum(axis=1)
+    scale = np.where(degree > 0, 1 / np.sqrt(np.where(degree > 0, degree, 1)), 0.0)
+    laplacian = np.eye(len(corr)) - scale[:, None] * affinity * scale[None, :]
+    _, vectors = np.linalg.eigh(laplacian)
+    return vectors[:, 1:dimensions + 1] * scale[:, None]
+
+
+# order of the symbols that puts correlated symbols next to each other, by the Fiedler vector
+def spectral_order(corr: pd.DataFrame) -> pd.Index:
+    if len(corr) < 3:
+        return corr.index
+    key = ('order', fingerprint(corr))
+    order = cache.get(key)
+    if order is None:
+        fiedler = _spectral_embedding(corr.to_numpy(), 1)[:, 0]
+        order = corr.index[np.argsort(fiedler, kind='stable')]
+        cache.put(key, order)
+    return order
+
+
+# cluster label of every symbol, k-means on the spectral embedding with a deterministic farthest-point start
+def clusters(corr: pd.DataFrame, k: int = 5, iterations: int = 50) -> pd.Series:
+    k = max(1, min(k, len(corr)))
+    if len(corr) <= k:
+        return pd.Series(np.arange(len(corr)), index=corr.index, name='cluster')
+    points = _spectral_embedding(corr.to_numpy(), k)
+    points = points / np.maximum(np.linalg.norm(points, axis=1, keepdims=True), 1e-12)
+    centres = [points[0]]
+    for _ in range(1, k):
+        distance = np.min([((points - centre) ** 2).sum(axis=1) for centre in centres], axis=0)
+        centres.append(points[np.argmax(distance)])
+    centres = np.array(centres)
+    labels = None
+    for _ in range(iterations):
+        distance = ((points[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2)
+        new_labels = distance.argmin(axis=1)
+        if labels is not None and (new_labels == labels).all():
+            break
+        labels = new_labels
+        for cluster in range(k):
+            if (labels == cluster).any():
+                centres[cluster] = points[labels == cluster].mean(axis=0)
+    return pd.Series(labels, index=corr.index, name='cluster')
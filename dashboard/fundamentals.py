@@ -0,0 +1,60 @@
+#######################
+# Fundamentals loader #
+#######################
+
+# import libraries
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import as_completed as _as_completed
+
+from dashboard.providers import get_provider
+
+# how long each yf.Ticker attribute stays fresh, in seconds
+# fundamentals only change when a quarter is reported and holders change rarely
+FIELD_TTLS = {
+    'recommendations': 6 * 60 * 60,
+    'financials': 24 * 60 * 60,
+    'balance_sheet': 24 * 60 * 60,
+    'cashflow': 24 * 60 * 60,
+    'institutional_holders': 7 * 24 * 60 * 60,
+    'major_holders': 7 * 24 * 60 * 60,
+}
+
+# every attribute is a separate http round trip, so they are fetched side by side
+_executor = ThreadPoolExecutor(max_workers=len(FIELD_TTLS), thread_name_prefix='fundamentals')
+_cache = {}
+_lock = threading.Lock()
+
+
+# fetch one attribute of a ticker and remember when it was fetched
+def _fetch(symbol: str, field: str):
+    value = get_provider().field(symbol, field)
+    with _lock:
+        _cache[(symbol, field)] = (time.monotonic(), value)
+    return value
+
+
+# start loading the requested fields of a symbol and return a dict of field -> Future
+# fields that are still fresh in the cache come back as already finished futures
+def load(symbol: str, fields=tuple(FIELD_TTLS)) -> dict:
+    futures = {}
+    now = time.monotonic()
+    for field in fields:
+        with _lock:
+            cached = _cache.get((symbol, field))
+        if cached is not None and now - cached[0] < FIELD_TTLS[field]:
+            future = Future()
+            future.set_result(cached[1])
+        else:
+            future = _executor.submit(_fetch, symbol, field)
+        futures[field] = future
+    return futures
+
+
+# yield (field, value, error) in the order the fields finish loading
+def as_completed(futures: dict):
+    fields = {future: field for field, future in futures.items()}
+    for future in _as_completed(fields):
+        error = future.exception()
+        yield fields[future], (None if error else future.result()), error
@@ -0,0 +1,88 @@
+##########################
+# Indicator result cache #
+##########################
+
+# import libraries
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard import indicators
+from dashboard.lru import LRUCache
+
+# memory the cached outputs may take before the least recently used ones are dropped
+CACHE_BYTES = int(float(os.environ.get('DASHBOARD_INDICATOR_CACHE_MB', 256)) * 1024 * 1024)
+
+
+# Content hash of a close series or panel, the values, the dates and the symbols all count,
+# so the same history downloaded again in another session lands on the same entries
+def fingerprint(close: indicators.SeriesOrPanel) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(close.to_numpy(dtype='float64')).data)
+    index = close.index
+    if isinstance(index, pd.DatetimeIndex):
+        digest.update(index.tz_localize(None).values.astype('datetime64[ns]').view('int64').data)
+        digest.update(str(index.tz).encode())
+    else:
+        digest.update(repr(list(index)).encode())
+    if isinstance(close, pd.DataFrame):
+        digest.update(repr(list(close.columns)).encode())
+    digest.update(str(close.shape).encode())
+    return digest.hexdigest()
+
+
+# Least recently used cache of indicator outputs with a byte budget, shared by every session
+class IndicatorCache(LRUCache):
+
+    def __init__(self, max_bytes: int = CACHE_BYTES):
+        super().__init__(max_bytes)
+
+
+# one cache per process
+cache = IndicatorCache()
+
+
+# indicators.compute_all behind the cache, only the outputs that were never computed for this
+# exact close and these parameters are computed, and those still share their intermediates
+def compute_all(
+    close: indicators.SeriesOrPanel,
+    specs: dict = indicators.PAGE_SPECS,
+    fillna: bool = False,
+    high: indicators.SeriesOrPanel = None,
+    low: indicators.SeriesOrPanel = None,
+) -> dict:
+    digest = fingerprint(close)
+    # the range indicators also depend on the high and the low
+    range_digest = None
+    if any(indicator in indicators.RANGE_INDICATORS for indicator, _, _ in specs.values()):
+        range_digest = tuple(None if data is None else fingerprint(data) for data in (high, low))
+    outputs = {}
+    missing = {}
+    keys = {}
+    for name, (indicator, method, params) in specs.items():
+        prices = (digest, range_digest) if indicator in indicators.RANGE_INDICATORS else digest
+        keys[name] = (prices, indicator, method, tuple(sorted(params.items())), fillna)
+        outputs[name] = cache.get(keys[name])
+        if outputs[name] is None:
+            missing[name] = (indicator, method, params)
+    if missing:
+        for name, output in indicators.compute_all(close, missing, fillna, high=high, low=low).items():
+            cache.put(keys[name], output)
+            outputs[name] = output
+    return outputs
+
+
+# indicators.compute_frame with the outputs coming from the cache, a warm page only copies them
+# into the frame's array
+def compute_frame(
+    close: pd.Series,
+    specs: dict = indicators.PAGE_SPECS,
+    fillna: bool = False,
+    high: pd.Series = None,
+    low: pd.Series = None,
+    with_close: bool = False,
+) -> pd.DataFrame:
+    outputs = compute_all(close, specs, fillna, high=high, low=low)
+    return indicators.compute_frame(close, specs, with_close=with_close, outputs=outputs)
@@ -0,0 +1,734 @@
+########################
+# Technical Indicators #
+########################
+
+# import libraries
+import math
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+# every indicator takes a single close series or a dates x symbols panel of closes
+SeriesOrPanel = Union[pd.Series, pd.DataFrame]
+
+
+# Create a Mixin of interdependent non-side-effect-free code that is shared between components.
+class IndicatorMixin:
+
+    _fillna = False
+    _shared = None
+    # reuse an intermediate result (a diff, an EMA, a rolling window) computed by another indicator on the same close
+    def _memo(self, key: tuple, function):
+        if self._shared is None:
+            return function()
+        if key not in self._shared:
+            self._shared[key] = function()
+        return self._shared[key]
+    # wrap an output like the close came in, a named Series for a Series and a dates x symbols frame for a panel
+    def _output(self, values, name: str = None) -> SeriesOrPanel:
+        if isinstance(self._close, pd.DataFrame):
+            if isinstance(values, pd.DataFrame):
+                return values
+            return pd.DataFrame(values, index=self._close.index, columns=self._close.columns)
+        if isinstance(values, pd.Series):
+            # an intermediate that already carries the right name goes out as is
+            return values if values.name == name else pd.Series(values, name=name)
+        return pd.Series(values, index=self._close.index, name=name)
+    # compute an output on first access and keep it on the instance, later calls return the same object
+    def _lazy(self, key: str, function):
+        outputs = self.__dict__.setdefault("_outputs", {})
+        if key not in outputs:
+            outputs[key] = function()
+        return outputs[key]
+    # fill the nulls of an output when asked to and wrap it, without fillna nothing is copied
+    def _finish(self, values, name: str, value: int = 0) -> SeriesOrPanel:
+        if self._fillna:
+            values = self._check_fillna(values, value=value)
+        return self._output(values, name=name)
+    # check nulls
+    def _check_fillna(self, series: SeriesOrPanel, value: int = 0) -> SeriesOrPanel:
+
+        if self._fillna:
+            series_output = series.copy(deep=False)
+            series_output = series_output.replace([np.inf, -np.inf], np.nan)
+            if isinstance(value, int) and value == -1:
+                series = series_output.ffill().fillna(value=-1)
+            else:
+                series = series_output.ffill().fillna(value)
+        return series
+
+    # rolling max or min of the highs or lows, shared between the range indicators built on the same bars
+    def _rolling_extreme(self, data: SeriesOrPanel, key: str, window: int, function: str) -> SeriesOrPanel:
+        min_periods = 0 if self._fillna else window
+        return self._memo(
+            (function, key, window, min_periods),
+            lambda: _rolling_max_min(data, window, min_periods, function),
+        )
+
+    @staticmethod
+    # define the True Range which is the greatest distance you can find between any two of these three prices.
+    def _true_range(
+        high: SeriesOrPanel, low: SeriesOrPanel, prev_close: SeriesOrPanel
+    ) -> SeriesOrPanel:
+        # the range stretched to the previous close when the bar gapped, without a previous close it is
+        # high - low; a missing bar has no true range, a zero would drag the average down
+        true_range = _get_min_max(high, prev_close, "max") - _get_min_max(low, prev_close, "min")
+        return true_range.where(prev_close.notna(), high - low)
+
+# define dropna function
+def dropna(df: pd.DataFrame) -> pd.DataFrame:
+    # Drop rows with null values
+    df = df.copy()
+    number_cols = df.select_dtypes("number").columns.to_list()
+    df[number_cols] = df[number_cols][df[number_cols] < math.exp(709)]  # big number
+    df[number_cols] = df[number_cols][df[number_cols] != 0.0]
+    df = df.dropna()
+    return df
+
+# exponentially weighted mean (adjust=False) of every column of a dates x symbols array in one pass over the dates,
+# the same recursion and NaN handling as pandas ewm so the numbers match; alpha and min_periods may also be
+# arrays with one entry per column, which lets many spans run side by side
+def _panel_ewm(values: np.ndarray, alpha, min_periods) -> np.ndarray:
+    output = np.empty_like(values)
+    if not len(values):
+        return output
+    factor = 1.0 - alpha
+    valid = ~np.isnan(values)
+    weighted = values[0].copy()
+    output[0] = weighted
+    if not (valid[:-1] & ~valid[1:]).any():
+        # no column has a gap once it started, so every step is the plain recursion
+        denominator = factor + alpha
+        for row in range(1, len(values)):
+            current = values[row]
+            blended = (factor * weighted + alpha * current) / denominator
+            weighted = np.where(np.isnan(weighted), current, blended)
+            output[row] = weighted
+    else:
+        # a gap keeps decaying the old weight until the next observation, like pandas with ignore_na=False
+        old_wt = np.ones(values.shape[1])
+        for row in range(1, len(values)):
+            current = values[row]
+            started = ~np.isnan(weighted)
+            old_wt = np.where(started, old_wt * factor, old_wt)
+            update = started & valid[row]
+            blended = (old_wt * weighted + alpha * current) / (old_wt + alpha)
+            weighted = np.where(update & (weighted != current), blended, weighted)
+            old_wt = np.where(update, 1.0, old_wt)
+            weighted = np.where(~started & valid[row], current, weighted)
+            output[row] = weighted
+    output[np.cumsum(valid, axis=0) < np.maximum(min_periods, 1)] = np.nan
+    return output
+
+# running sums of every column of a dates x symbols array, centred first so they stay small and the
+# variance keeps its precision, any number of rolling windows can then be read off the same sums
+def _rolling_sums(values: np.ndarray):
+    valid = ~np.isnan(values)
+    centre = np.zeros(values.shape[1])
+    has_values = valid.any(axis=0)
+    centre[has_values] = np.nanmean(values[:, has_values], axis=0)
+    centred = np.where(valid, values - centre, 0.0)
+    zeros = np.zeros((1, values.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(centred, axis=0)])
+    squares = np.concatenate([zeros, np.cumsum(centred * centred, axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+    return centre, sums, squares, counts
+
+# rolling mean and population std of every column of a dates x symbols array from cumulative sums,
+# a window containing a NaN gives NaN like pandas with min_periods equal to the window
+def _panel_rolling(values: np.ndarray, window: int, running: tuple = None):
+    centre, sums, squares, counts = _rolling_sums(values) if running is None else running
+    full = (counts[window:] - counts[:-window]) == window
+    mean = (sums[window:] - sums[:-window]) / window
+    variance = np.maximum((squares[window:] - squares[:-window]) / window - mean * mean, 0.0)
+    head = np.full((min(window - 1, len(values)), values.shape[1]), np.nan)
+    return (
+        np.concatenate([head, np.where(full, mean + centre, np.nan)]),
+        np.concatenate([head, np.where(full, np.sqrt(variance), np.nan)]),
+    )
+
+# exponentially weighted mean (adjust=False), panels go through the NumPy kernel and series through pandas
+def _ewm_mean(data, min_periods: int, span: float = None, alpha: float = None):
+    if isinstance(data, pd.DataFrame):
+        alpha = 2.0 / (span + 1.0) if alpha is None else alpha
+        values = _panel_ewm(data.to_numpy(dtype="float64"), alpha, min_periods)
+        return pd.DataFrame(values, index=data.index, columns=data.columns)
+    return data.ewm(span=span, alpha=alpha, min_periods=min_periods, adjust=False).mean()
+
+# rolling mean and population std, panels without fillna go through the NumPy kernel and everything else through pandas
+def _rolling_mean_std(data, window: int, min_periods: int):
+    if isinstance(data, pd.DataFrame) and min_periods == window and len(data) >= window:
+        mean, std = _panel_rolling(data.to_numpy(dtype="float64"), window)
+        return (
+            pd.DataFrame(mean, index=data.index, columns=data.columns),
+            pd.DataFrame(std, index=data.index, columns=data.columns),
+        )
+    rolling = data.rolling(window, min_periods=min_periods)
+    return rolling.mean(), rolling.std(ddof=0)
+
+# define simple moving average (SMA)
+def _sma(series, periods: int, fillna: bool = False):
+    min_periods = 0 if fillna else periods
+    return _rolling_mean_std(series, periods, min_periods)[0]
+
+# define exponential moving average (EMA) that places a greater weight and significance on the most recent data points.
+def _ema(series, periods, fillna=False):
+    min_periods = 0 if fillna else periods
+    return _ewm_mean(series, min_periods, span=periods)
+
+# Calling min() and max() With a Single Iterable Argument
+def _get_min_max(series1: SeriesOrPanel, series2: SeriesOrPanel, function: str = "min"):
+    # Find min or max value between two series for each index, missing on either side gives NaN
+    if function == "min":
+        output = np.minimum(series1, series2)
+    elif function == "max":
+        output = np.maximum(series1, series2)
+    else:
+        raise ValueError('"f" variable value should be "min" or "max"')
+
+    if isinstance(output, (pd.Series, pd.DataFrame)):
+        return output
+    return pd.Series(output)
+
+# rolling max or min of every column of a dates x symbols array with the van Herk/Gil-Werman algorithm:
+# running extremes from the start and from the end of each block of window rows give every window from
+# two lookups, so the cost is a few passes over the data whatever the window; a window with a NaN gives NaN
+def _panel_max_min(values: np.ndarray, window: int, function: str = "max") -> np.ndarray:
+    accumulate = np.maximum.accumulate if function == "max" else np.minimum.accumulate
+    combine = np.maximum if function == "max" else np.minimum
+    rows, columns = values.shape
+    valid = ~np.isnan(values)
+    blocks = -(-rows // window)
+    padded = np.full((blocks * window, columns), -np.inf if function == "max" else np.inf)
+    padded[:rows] = np.where(valid, values, padded[:rows])
+    padded = padded.reshape(blocks, window, columns)
+    from_start = accumulate(padded, axis=1).reshape(-1, columns)
+    from_end = accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, columns)
+    output = np.full((rows, columns), np.nan)
+    if rows >= window:
+        output[window - 1:] = combine(from_end[: rows - window + 1], from_start[window - 1: rows])
+        counts = np.concatenate([np.zeros((1, columns)), np.cumsum(valid, axis=0)])
+        output[window - 1:][(counts[window:] - counts[:-window]) < window] = np.nan
+    return output
+
+# rolling max or min, full windows go through the O(n) kernel and the partial windows of fillna through pandas
+def _rolling_max_min(data: SeriesOrPanel, window: int, min_periods: int, function: str = "max") -> SeriesOrPanel:
+    if min_periods != window:
+        rolling = data.rolling(window, min_periods=min_periods)
+        return rolling.max() if function == "max" else rolling.min()
+    values = data.to_numpy(dtype="float64")
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame(_panel_max_min(values, window, function), index=data.index, columns=data.columns)
+    return pd.Series(_panel_max_min(values[:, np.newaxis], window, function)[:, 0], index=data.index, name=data.name)
+
+# Setup BollingerBands
+class BollingerBands(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        close: SeriesOrPanel,
+        window: int = 20,
+        window_dev: int = 2,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._close = close
+        self._window = window
+        self._window_dev = window_dev
+        self._fillna = fillna
+        self._shared = shared
+    # rolling mean and standard deviation, every band is built from these
+    def _rolling(self):
+        min_periods = 0 if self._fillna else self._window
+        return self._lazy("rolling", lambda: self._memo(
+            ("rolling", self._window, min_periods),
+            lambda: _rolling_mean_std(self._close, self._window, min_periods),
+        ))
+    def _mavg(self):
+        return self._rolling()[0]
+    def _hband(self):
+        return self._lazy("hband", lambda: self._rolling()[0] + self._window_dev * self._rolling()[1])
+    def _lband(self):
+        return self._lazy("lband", lambda: self._rolling()[0] - self._window_dev * self._rolling()[1])
+    # define bollinger moving average Bollinger, channel middle band and returns pandas.Series new feature generated
+    def bollinger_mavg(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_mavg", lambda: self._finish(self._mavg(), "mavg", value=-1))
+    # Add bollinger band high indicator filling nans values, channel middle band and returns pandas.Series new feature generated
+    def bollinger_hband(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_hband", lambda: self._finish(self._hband(), "hband", value=-1))
+    # Add bollinger band low indicator filling nans values, channel lower band and returns pandas.Series new feature generated
+    def bollinger_lband(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_lband", lambda: self._finish(self._lband(), "lband", value=-1))
+    # Add bollinger band width indicator filling nans values, channel width band and returns pandas.Series new feature generated
+    def bollinger_wband(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_wband", lambda: self._finish(
+            ((self._hband() - self._lband()) / self._mavg()) * 100, "bbiwband"
+        ))
+    # Add bollinger band percentage indicator filling nans values, channel percentage band and returns pandas.Series new feature generated
+    def bollinger_pband(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_pband", lambda: self._finish(
+            (self._close - self._lband()) / (self._hband() - self._lband()), "bbipband"
+        ))
+    # Bollinger Channel Indicator Crossing High Band (binary). It returns 1, if close is higher than bollinger_hband. Else, it returns 0 and returns pandas.Series new feature generated
+    def bollinger_hband_indicator(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_hband_indicator", lambda: self._finish(
+            self._output(np.where(self._close > self._hband(), 1.0, 0.0)), "bbihband"
+        ))
+    # Bollinger Channel Indicator Crossing Low Band (binary). It returns 1, if close is lower than bollinger_lband. Else, it returns 0 and returns pandas.Series new feature generated
+    def bollinger_lband_indicator(self) -> SeriesOrPanel:
+        return self._lazy("bollinger_lband_indicator", lambda: self._finish(
+            self._output(np.where(self._close < self._lband(), 1.0, 0.0)), "bbilband"
+        ))
+
+# Relative Strength Index (RSI) Compares the magnitude of recent gains and losses over a specified time period to measure speed and change of price movements of a security. It is primarily used to attempt to identify overbought or oversold conditions in the trading of an asset.
+class RSIIndicator(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(self, close: SeriesOrPanel, window: int = 14, fillna: bool = False, shared: dict = None):
+        self._close = close
+        self._window = window
+        self._fillna = fillna
+        self._shared = shared
+    # define the Relative Strength Index run function
+    def _rsi(self):
+        diff = self._memo(("diff",), lambda: self._close.diff(1))
+        # rows before a symbol's first close stay missing, a panel column that starts late has no flat bars there
+        started = self._close.notna().cummax()
+        up_direction = diff.where(diff > 0, 0.0).where(started)
+        down_direction = -diff.where(diff < 0, 0.0).where(started)
+        min_periods = 0 if self._fillna else self._window
+        emaup = _ewm_mean(up_direction, min_periods, alpha=1 / self._window)
+        emadn = _ewm_mean(down_direction, min_periods, alpha=1 / self._window)
+        relative_strength = emaup / emadn
+        return self._output(
+            np.where(emadn == 0, 100, 100 - (100 / (1 + relative_strength)))
+        )
+    # define Relative Strength Index (RSI) check nulls and returns pandas.Series new feature generated
+    def rsi(self) -> SeriesOrPanel:
+        return self._lazy("rsi", lambda: self._finish(self._rsi(), "rsi", value=50))
+
+# Moving Average Convergence Divergence (MACD) Is a trend-following momentum indicator that shows the relationship between two moving averages of prices.
+class MACD(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        close: SeriesOrPanel,
+        window_slow: int = 26,
+        window_fast: int = 12,
+        window_sign: int = 9,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._close = close
+        self._window_slow = window_slow
+        self._window_fast = window_fast
+        self._window_sign = window_sign
+        self._fillna = fillna
+        self._shared = shared
+    # define the Moving Average Convergence Divergence (MACD) line, the signal and histogram build on it
+    def _macd(self):
+        def run():
+            emafast = self._memo(
+                ("ema", self._window_fast, self._fillna),
+                lambda: _ema(self._close, self._window_fast, self._fillna),
+            )
+            emaslow = self._memo(
+                ("ema", self._window_slow, self._fillna),
+                lambda: _ema(self._close, self._window_slow, self._fillna),
+            )
+            return emafast - emaslow
+        return self._lazy("macd_line", run)
+    def _macd_signal(self):
+        return self._lazy("macd_signal_line", lambda: _ema(self._macd(), self._window_sign, self._fillna))
+    # define MACD line, check nulls and returns pandas.Series new feature generated
+    def macd(self) -> SeriesOrPanel:
+        return self._lazy("macd", lambda: self._finish(
+            self._macd(), f"MACD_{self._window_fast}_{self._window_slow}"
+        ))
+    # define MACD signal, check nulls and returns pandas.Series new feature generated
+    def macd_signal(self) -> SeriesOrPanel:
+        return self._lazy("macd_signal", lambda: self._finish(
+            self._macd_signal(), f"MACD_sign_{self._window_fast}_{self._window_slow}"
+        ))
+    # define MACD histogram, check nulls and returns pandas.Series new feature generated
+    def macd_diff(self) -> SeriesOrPanel:
+        return self._lazy("macd_diff", lambda: self._finish(
+            self._macd() - self._macd_signal(), f"MACD_diff_{self._window_fast}_{self._window_slow}"
+        ))
+
+# The Rate-of-Change (ROC) indicator, which is also referred to as simply Momentum, is a pure momentum oscillator. The ROC calculation compares the current price with the price "n" periods ago
+class ROCIndicator(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(self, close: SeriesOrPanel, window: int = 12, fillna: bool = False, shared: dict = None):
+        self._close = close
+        self._window = window
+        self._fillna = fillna
+        self._shared = shared
+    # define the rate of change run function
+    def _roc(self):
+        shifted = self._memo(("shift", self._window), lambda: self._close.shift(self._window))
+        return ((self._close - shifted) / shifted) * 100
+    # define rate of change, check nulls and returns pandas.Series new feature generated
+    def roc(self) -> SeriesOrPanel:
+        return self._lazy("roc", lambda: self._finish(self._roc(), "roc"))
+
+# The true strength index (TSI) is a technical momentum oscillator used to identify trends and reversals. The indicator may be useful for determining overbought and oversold conditions, indicating potential trend direction changes via centerline or signal line crossovers, and warning of trend weakness through divergence.
+class TSIIndicator(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        close: SeriesOrPanel,
+        window_slow: int = 25,
+        window_fast: int = 13,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._close = close
+        self._window_slow = window_slow
+        self._window_fast = window_fast
+        self._fillna = fillna
+        self._shared = shared
+    # define the true strength index run function
+    def _tsi(self):
+        diff_close = self._memo(("diff",), lambda: self._close.diff(1))
+        min_periods_r = 0 if self._fillna else self._window_slow
+        min_periods_s = 0 if self._fillna else self._window_fast
+        smoothed = _ewm_mean(
+            _ewm_mean(diff_close, min_periods_r, span=self._window_slow),
+            min_periods_s,
+            span=self._window_fast,
+        )
+        smoothed_abs = _ewm_mean(
+            _ewm_mean(abs(diff_close), min_periods_r, span=self._window_slow),
+            min_periods_s,
+            span=self._window_fast,
+        )
+        tsi = smoothed / smoothed_abs
+        tsi *= 100
+        return tsi
+    # define the true strength index, check nulls and returns pandas.Series new feature generated
+    def tsi(self) -> SeriesOrPanel:
+        return self._lazy("tsi", lambda: self._finish(self._tsi(), "tsi"))
+
+# Average True Range (ATR) Measures market volatility as the Wilder smoothed average of the true range, the greatest of the bar's range and its gaps from the previous close.
+class AverageTrueRange(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        high: SeriesOrPanel,
+        low: SeriesOrPanel,
+        close: SeriesOrPanel,
+        window: int = 14,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._fillna = fillna
+        self._shared = shared
+    # define the average true range run function, every column is seeded with the mean of the first window of
+    # true ranges from its own first bar, so a panel column that starts late is seeded where it would be on its own
+    def _atr(self):
+        true_range = self._memo(
+            ("true_range",), lambda: self._true_range(self._high, self._low, self._close.shift(1))
+        )
+        values = true_range.to_numpy(dtype="float64").reshape(len(true_range), -1)
+        valid = ~np.isnan(values)
+        rows = np.arange(len(values))[:, None]
+        first = np.where(valid.any(axis=0), valid.argmax(axis=0), len(values))
+        seed_row = first + self._window - 1
+        # the window mean skips missing bars like Series.mean, nothing comes before a column's first bar
+        total = np.cumsum(np.where(valid, values, 0.0), axis=0)
+        count = np.cumsum(valid, axis=0)
+        seeded = np.where(rows > seed_row, values, np.nan)
+        columns = np.flatnonzero(seed_row < len(values))
+        seeded[seed_row[columns], columns] = total[seed_row[columns], columns] / count[seed_row[columns], columns]
+        if isinstance(true_range, pd.DataFrame):
+            seed = pd.DataFrame(seeded, index=true_range.index, columns=true_range.columns)
+        else:
+            seed = pd.Series(seeded[:, 0], index=true_range.index)
+        # atr[i] = (atr[i - 1] * (window - 1) + true_range[i]) / window is an EMA with alpha 1 / window
+        return _ewm_mean(seed, 0, alpha=1 / self._window)
+    # define the average true range, check nulls and returns pandas.Series new feature generated
+    def average_true_range(self) -> SeriesOrPanel:
+        return self._lazy("average_true_range", lambda: self._finish(self._atr(), "atr"))
+
+# Keltner Channels are volatility based envelopes set above and below a moving average of the typical price, a break above or below the channel signals a strong move.
+class KeltnerChannel(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        high: SeriesOrPanel,
+        low: SeriesOrPanel,
+        close: SeriesOrPanel,
+        window: int = 20,
+        window_atr: int = 10,
+        fillna: bool = False,
+        original_version: bool = True,
+        multiplier: int = 2,
+        shared: dict = None,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._window_atr = window_atr
+        self._fillna = fillna
+        self._original_version = original_version
+        self._multiplier = multiplier
+        self._shared = shared
+    # the original version averages typical prices, the newer one offsets an EMA of the close by the ATR
+    def _bands(self):
+        def run():
+            if self._original_version:
+                mband = _sma((self._high + self._low + self._close) / 3.0, self._window, self._fillna)
+                hband = _sma(((4 * self._high) - (2 * self._low) + self._close) / 3.0, self._window, self._fillna)
+                lband = _sma(((-2 * self._high) + (4 * self._low) + self._close) / 3.0, self._window, self._fillna)
+            else:
+                mband = _ema(self._close, self._window, self._fillna)
+                atr = AverageTrueRange(
+                    self._high, self._low, self._close, self._window_atr, fillna=self._fillna, shared=self._shared
+                ).average_true_range()
+                hband = mband + self._multiplier * atr
+                lband = mband - self._multiplier * atr
+            return mband, hband, lband
+        return self._lazy("bands", run)
+    # define the keltner channel middle band, check nulls and returns pandas.Series new feature generated
+    def keltner_channel_mband(self) -> SeriesOrPanel:
+        return self._lazy("keltner_channel_mband", lambda: self._finish(self._bands()[0], "mavg"))
+    # define the keltner channel high band, check nulls and returns pandas.Series new feature generated
+    def keltner_channel_hband(self) -> SeriesOrPanel:
+        return self._lazy("keltner_channel_hband", lambda: self._finish(self._bands()[1], "kc_hband"))
+    # define the keltner channel low band, check nulls and returns pandas.Series new feature generated
+    def keltner_channel_lband(self) -> SeriesOrPanel:
+        return self._lazy("keltner_channel_lband", lambda: self._finish(self._bands()[2], "kc_lband"))
+    # define the keltner channel width, check nulls and returns pandas.Series new feature generated
+    def keltner_channel_wband(self) -> SeriesOrPanel:
+        def run():
+            mband, hband, lband = self._bands()
+            return ((hband - lband) / mband) * 100
+        return self._lazy("keltner_channel_wband", lambda: self._finish(run(), "bbiwband"))
+    # define the keltner channel percentage band, check nulls and returns pandas.Series new feature generated
+    def keltner_channel_pband(self) -> SeriesOrPanel:
+        def run():
+            mband, hband, lband = self._bands()
+            return (self._close - lband) / (hband - lband)
+        return self._lazy("keltner_channel_pband", lambda: self._finish(run(), "bbipband"))
+    # Keltner Channel Indicator Crossing High Band (binary). It returns 1, if close is higher than keltner_channel_hband. Else, it returns 0
+    def keltner_channel_hband_indicator(self) -> SeriesOrPanel:
+        return self._lazy("keltner_channel_hband_indicator", lambda: self._finish(
+            self._output(np.where(self._close > self._bands()[1], 1.0, 0.0)), "dcihband"
+        ))
+    # Keltner Channel Indicator Crossing Low Band (binary). It returns 1, if close is lower than keltner_channel_lband. Else, it returns 0
+    def keltner_channel_lband_indicator(self) -> SeriesOrPanel:
+        return self._lazy("keltner_channel_lband_indicator", lambda: self._finish(
+            self._output(np.where(self._close < self._bands()[2], 1.0, 0.0)), "dcilband"
+        ))
+
+# Donchian Channels are the highest high and the lowest low of the last n bars, a close outside the previous channel marks a breakout.
+class DonchianChannel(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        high: SeriesOrPanel,
+        low: SeriesOrPanel,
+        close: SeriesOrPanel,
+        window: int = 20,
+        offset: int = 0,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._offset = offset
+        self._fillna = fillna
+        self._shared = shared
+    def _hband(self):
+        hband = self._rolling_extreme(self._high, "high", self._window, "max")
+        return hband.shift(self._offset) if self._offset else hband
+    def _lband(self):
+        lband = self._rolling_extreme(self._low, "low", self._window, "min")
+        return lband.shift(self._offset) if self._offset else lband
+    # define the donchian channel high band, check nulls and returns pandas.Series new feature generated
+    def donchian_channel_hband(self) -> SeriesOrPanel:
+        return self._lazy("donchian_channel_hband", lambda: self._finish(self._hband(), "dchband"))
+    # define the donchian channel low band, check nulls and returns pandas.Series new feature generated
+    def donchian_channel_lband(self) -> SeriesOrPanel:
+        return self._lazy("donchian_channel_lband", lambda: self._finish(self._lband(), "dclband"))
+    # define the donchian channel middle band, check nulls and returns pandas.Series new feature generated
+    def donchian_channel_mband(self) -> SeriesOrPanel:
+        return self._lazy("donchian_channel_mband", lambda: self._finish(
+            ((self._hband() - self._lband()) / 2.0) + self._lband(), "dcmband"
+        ))
+    # define the donchian channel width against the moving average of the close, check nulls and returns pandas.Series new feature generated
+    def donchian_channel_wband(self) -> SeriesOrPanel:
+        def run():
+            mavg = _sma(self._close, self._window, self._fillna)
+            return ((self._hband() - self._lband()) / mavg) * 100
+        return self._lazy("donchian_channel_wband", lambda: self._finish(run(), "dcwband"))
+    # define the donchian channel percentage band, check nulls and returns pandas.Series new feature generated
+    def donchian_channel_pband(self) -> SeriesOrPanel:
+        return self._lazy("donchian_channel_pband", lambda: self._finish(
+            (self._close - self._lband()) / (self._hband() - self._lband()), "dcpband"
+        ))
+
+# Stochastic Oscillator Compares the close with the range of the last n bars, %K is where the close sits in that range and %D is its moving average.
+class StochasticOscillator(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        high: SeriesOrPanel,
+        low: SeriesOrPanel,
+        close: SeriesOrPanel,
+        window: int = 14,
+        smooth_window: int = 3,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._window = window
+        self._smooth_window = smooth_window
+        self._fillna = fillna
+        self._shared = shared
+    # define the stochastic %K run function
+    def _stoch_k(self):
+        def run():
+            smin = self._rolling_extreme(self._low, "low", self._window, "min")
+            smax = self._rolling_extreme(self._high, "high", self._window, "max")
+            return 100 * (self._close - smin) / (smax - smin)
+        return self._lazy("stoch_k", run)
+    # define the stochastic oscillator %K, check nulls and returns pandas.Series new feature generated
+    def stoch(self) -> SeriesOrPanel:
+        return self._lazy("stoch", lambda: self._finish(self._stoch_k(), "stoch_k"))
+    # define the stochastic oscillator signal %D, check nulls and returns pandas.Series new feature generated
+    def stoch_signal(self) -> SeriesOrPanel:
+        return self._lazy("stoch_signal", lambda: self._finish(
+            _sma(self._stoch_k(), self._smooth_window, self._fillna), "stoch_k_signal"
+        ))
+
+# Williams %R Shows where the close sits against the highest high of the last n bars, from 0 (at the high) down to -100 (at the low).
+class WilliamsRIndicator(IndicatorMixin):
+    # The __init__ function is called every time an object is created from a class
+    def __init__(
+        self,
+        high: SeriesOrPanel,
+        low: SeriesOrPanel,
+        close: SeriesOrPanel,
+        lbp: int = 14,
+        fillna: bool = False,
+        shared: dict = None,
+    ):
+        self._high = high
+        self._low = low
+        self._close = close
+        self._lbp = lbp
+        self._fillna = fillna
+        self._shared = shared
+    # define the williams %r run function
+    def _wr(self):
+        highest_high = self._rolling_extreme(self._high, "high", self._lbp, "max")
+        lowest_low = self._rolling_extreme(self._low, "low", self._lbp, "min")
+        return -100 * (highest_high - self._close) / (highest_high - lowest_low)
+    # define williams %r, check nulls and returns pandas.Series new feature generated
+    def williams_r(self) -> SeriesOrPanel:
+        return self._lazy("williams_r", lambda: self._finish(self._wr(), "wr"))
+
+# indicator classes compute_all can build, by spec name
+INDICATORS = {
+    "bollinger": BollingerBands,
+    "rsi": RSIIndicator,
+    "macd": MACD,
+    "tsi": TSIIndicator,
+    "roc": ROCIndicator,
+    "atr": AverageTrueRange,
+    "keltner": KeltnerChannel,
+    "donchian": DonchianChannel,
+    "stochastic": StochasticOscillator,
+    "williams_r": WilliamsRIndicator,
+}
+# indicators built from the high and the low as well as the close
+RANGE_INDICATORS = ("atr", "keltner", "donchian", "stochastic", "williams_r")
+
+# the outputs every asset page charts, as output name -> (indicator, output method, parameters)
+PAGE_SPECS = {
+    "Bollinger_Band_High": ("bollinger", "bollinger_hband", {}),
+    "Bollinger_Band_Low": ("bollinger", "bollinger_lband", {}),
+    "macd": ("macd", "macd", {}),
+    "rsi": ("rsi", "rsi", {}),
+    "tsi": ("tsi", "tsi", {}),
+    "roc": ("roc", "roc", {}),
+}
+
+# the range and volatility outputs the commodities and currencies pages chart on top of PAGE_SPECS
+RANGE_PAGE_SPECS = {
+    **PAGE_SPECS,
+    "atr": ("atr", "average_true_range", {}),
+    "Keltner_Channel_High": ("keltner", "keltner_channel_hband", {}),
+    "Keltner_Channel_Low": ("keltner", "keltner_channel_lband", {}),
+    "Donchian_Channel_High": ("donchian", "donchian_channel_hband", {}),
+    "Donchian_Channel_Low": ("donchian", "donchian_channel_lband", {}),
+    "stoch": ("stochastic", "stoch", {}),
+    "stoch_signal": ("stochastic", "stoch_signal", {}),
+    "williams_r": ("williams_r", "williams_r", {}),
+}
+
+
+# Compute many indicator outputs of one close series in a single pass. Indicators with the same
+# parameters are built once (both Bollinger bands come from one BollingerBands) and every indicator
+# shares intermediate results such as close.diff() (RSI and TSI) and the EMAs (MACD).
+# The range indicators also need the high and the low, they share the true range and rolling extremes.
+def compute_all(
+    close: SeriesOrPanel,
+    specs: dict = PAGE_SPECS,
+    fillna: bool = False,
+    high: SeriesOrPanel = None,
+    low: SeriesOrPanel = None,
+) -> dict:
+    shared = {}
+    instances = {}
+    outputs = {}
+    for name, (indicator, method, params) in specs.items():
+        key = (indicator, tuple(sorted(params.items())))
+        if key not in instances:
+            if indicator in RANGE_INDICATORS:
+                if high is None or low is None:
+                    raise ValueError(f"{indicator} needs the high and the low as well as the close")
+                instances[key] = INDICATORS[indicator](high, low, close, fillna=fillna, shared=shared, **params)
+            else:
+                instances[key] = INDICATORS[indicator](close, fillna=fillna, shared=shared, **params)
+        outputs[name] = getattr(instances[key], method)()
+    return outputs
+
+
+# Copy the outputs of compute_all into one dates x outputs array that backs a single DataFrame, so no
+# column is ever inserted into a frame. The kernels still build every output as its own Series (the
+# cache keeps those), so this is one more copy per output, not an in-place write; what it saves is the
+# column inserts and block consolidation of the price frame. Each column is contiguous (Fortran order),
+# so every output read back from the frame is a view.
+def compute_frame(
+    close: pd.Series,
+    specs: dict = PAGE_SPECS,
+    fillna: bool = False,
+    high: pd.Series = None,
+    low: pd.Series = None,
+    with_close: bool = False,
+    outputs: dict = None,
+) -> pd.DataFrame:
+    outputs = compute_all(close, specs, fillna, high=high, low=low) if outputs is None else outputs
+    columns = (["Close"] if with_close else []) + list(specs)
+    values = np.empty((len(close), len(columns)), order="F")
+    position = 0
+    if with_close:
+        values[:, 0] = close.to_numpy(dtype="float64")
+        position = 1
+    for name in specs:
+        values[:, position] = outputs[name].to_numpy(dtype="float64")
+        position += 1
+    return pd.DataFrame(values, index=close.index, columns=columns, copy=False)
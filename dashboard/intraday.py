@@ -0,0 +1,181 @@
+#################
+# Intraday bars #
+#################
+
+# import libraries
+import datetime
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard.providers import get_provider
+from dashboard.streaming import StreamingSet
+
+# intervals the pages offer, daily bars still come from the price store
+INTERVALS = ('1d', '1h', '5m', '1m')
+# how far back yahoo finance serves each interval, in days
+LOOKBACK_DAYS = {'1m': 7, '2m': 60, '5m': 60, '15m': 60, '30m': 60, '1h': 730}
+# bars kept per symbol, roughly the full lookback of a market that trades around the clock,
+# DASHBOARD_INTRADAY_BARS caps every interval at the same number of bars
+RETENTION_BARS = {'1m': 7 * 1440, '2m': 60 * 720, '5m': 60 * 288, '15m': 60 * 96, '30m': 60 * 48, '1h': 730 * 24}
+MAX_BARS = int(os.environ.get('DASHBOARD_INTRADAY_BARS', 0))
+# a buffer is not refreshed again until its interval has passed, a new bar cannot exist before that
+REFRESH_SECONDS = {'1m': 60, '2m': 120, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600}
+
+
+# Fixed-size circular buffer of bars, the oldest bars are overwritten once it is full
+class RingBuffer:
+
+    def __init__(self, capacity: int, columns):
+        self.columns = list(columns)
+        self._times = np.zeros(capacity, dtype='int64')
+        self._values = np.full((capacity, len(self.columns)), np.nan)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._times)
+
+    # UTC nanosecond timestamp of the newest bar, None while empty
+    def last_time(self):
+        if not self._size:
+            return None
+        return int(self._times[(self._start + self._size - 1) % self.capacity])
+
+    # add the bars of a frame that are newer than what we hold, the newest bar we hold is
+    # replaced because the bar that is still forming keeps changing; returns the number of new bars
+    def append(self, frame: pd.DataFrame) -> int:
+        if frame.empty:
+            return 0
+        # nanoseconds since the epoch in UTC whatever the unit and timezone of the index
+        times = frame.index.tz_convert('UTC').values.astype('datetime64[ns]').view('int64')
+        values = frame.reindex(columns=self.columns).to_numpy(dtype='float64')
+        last = self.last_time()
+        if last is not None:
+            keep = times >= last
+            times, values = times[keep], values[keep]
+            if len(times) and times[0] == last:
+                self._values[(self._start + self._size - 1) % self.capacity] = values[0]
+                times, values = times[1:], values[1:]
+        # more new bars than fit, only the newest ones survive anyway
+        times, values = times[-self.capacity:], values[-self.capacity:]
+        count = len(times)
+        positions = (self._start + self._size + np.arange(count)) % self.capacity
+        self._times[positions] = times
+        self._values[positions] = values
+        overflow = max(0, self._size + count - self.capacity)
+        self._size = min(self._size + count, self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        return count
+
+    # UTC nanosecond times and values of one column, oldest first, without building a frame
+    def column(self, name: str):
+        order = (self._start + np.arange(self._size)) % self.capacity
+        return self._times[order], self._values[order, self.columns.index(name)]
+
+    # the bars oldest first as a frame with the index in the given timezone
+    def frame(self, tz='UTC') -> pd.DataFrame:
+        order = (self._start + np.arange(self._size)) % self.capacity
+        index = pd.DatetimeIndex(pd.to_datetime(self._times[order], utc=True)).tz_convert(tz)
+        return pd.DataFrame(self._values[order], index=index, columns=self.columns)
+
+
+# Per symbol ring buffers of intraday bars, each refresh only downloads the bars after the newest one held
+class IntradayFeed:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffers = {}
+
+    # capacity of a new buffer for an interval
+    @staticmethod
+    def _capacity(interval: str) -> int:
+        bars = RETENTION_BARS.get(interval, 10000)
+        return min(bars, MAX_BARS) if MAX_BARS else bars
+
+    # bring the buffer of a symbol up to date and return its bars
+    def bars(self, symbol: str, interval: str) -> pd.DataFrame:
+        entry = self._entry(symbol, interval)
+        with entry['lock']:
+            self._maybe_refresh(symbol, interval, entry)
+            if entry['buffer'] is None:
+                return pd.DataFrame()
+            return entry['buffer'].frame(entry['tz'])
+
+    # latest page indicator values of a symbol without recomputing its history; the streaming state is
+    # only built on the first call and after that only the bars that closed since the last call go through it
+    def latest(self, symbol: str, interval: str) -> dict:
+        entry = self._entry(symbol, interval)
+        with entry['lock']:
+            self._maybe_refresh(symbol, interval, entry)
+            self._stream(entry)
+            if entry['buffer'] is None or not len(entry['buffer']):
+                return entry['stream'].values()
+            return entry['stream'].preview(entry['forming'])
+
+    def _entry(self, symbol: str, interval: str) -> dict:
+        with self._lock:
+            entry = self._buffers.get((symbol, interval))
+            if entry is None:
+                entry = {'buffer': None, 'tz': 'UTC', 'fetched': 0.0, 'lock': threading.Lock(), 'stream': StreamingSet(), 'streamed': None}
+                self._buffers[(symbol, interval)] = entry
+            return entry
+
+    def _maybe_refresh(self, symbol: str, interval: str, entry: dict):
+        if time.monotonic() - entry['fetched'] >= REFRESH_SECONDS.get(interval, 60):
+            self._refresh(symbol, interval, entry)
+
+    # push the bars that closed since the last call into the streaming indicators,
+    # the newest bar is still forming and only gets previewed
+    def _stream(self, entry: dict):
+        buffer = entry['buffer']
+        if buffer is None or not len(buffer):
+            return
+        times, close = buffer.column('Close')
+        first = 0 if entry['streamed'] is None else times.searchsorted(entry['streamed'], side='right')
+        closed = close[first:-1]
+        if len(closed):
+            entry['stream'].seed(pd.Series(closed))
+            entry['streamed'] = int(times[-2])
+        entry['forming'] = float(close[-1])
+
+    def _refresh(self, symbol: str, interval: str, entry: dict):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        buffer = entry['buffer']
+        if buffer is None or not len(buffer):
+            start = now - datetime.timedelta(days=LOOKBACK_DAYS.get(interval, 7) - 1)
+        else:
+            # start at the newest bar we hold so it gets its final values
+            start = pd.Timestamp(buffer.last_time(), tz='UTC').to_pydatetime()
+        frame = get_provider().history(symbol, start, now + datetime.timedelta(days=1), interval)
+        entry['fetched'] = time.monotonic()
+        if frame.empty:
+            return
+        if frame.index.tz is None:
+            frame = frame.tz_localize('UTC')
+        if buffer is None:
+            buffer = entry['buffer'] = RingBuffer(self._capacity(interval), frame.columns)
+            entry['tz'] = frame.index.tz
+        buffer.append(frame)
+
+
+# one feed per process, shared by every session
+feed = IntradayFeed()
+
+
+# intraday bars of a symbol between two dates, both dates included so today's session shows
+def download(symbol: str, start, end, interval: str) -> pd.DataFrame:
+    frame = feed.bars(symbol, interval)
+    if frame.empty:
+        return frame
+    wall_time = frame.index.tz_localize(None)
+    first = wall_time.searchsorted(pd.Timestamp(start), side='left')
+    last = wall_time.searchsorted(pd.Timestamp(end) + pd.Timedelta(days=1), side='left')
+    return frame.iloc[first:last].copy()
@@ -0,0 +1,67 @@
+#########################
+# Byte budget LRU cache #
+#########################
+
+# import libraries
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+# bytes a cached value holds on to, its values plus its index
+def _size(value) -> int:
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(value.to_numpy().nbytes + value.index.nbytes)
+    if isinstance(value, (np.ndarray, pd.Index)):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(_size(item) for item in value)
+    return 64
+
+
+# Least recently used cache with a byte budget, safe to share between sessions
+class LRUCache:
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = _size(value)
+        with self._lock:
+            if size > self._max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # hit and miss counters, number of entries and bytes held
+    def stats(self) -> dict:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._bytes}
@@ -0,0 +1,147 @@
+###########################
+# Mean-variance optimizer #
+###########################
+
+# import libraries
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard import correlation
+from dashboard.indicator_cache import fingerprint
+
+# random portfolios drawn for the Monte Carlo cloud
+SIMULATIONS = 5000
+# target returns solved along the frontier
+FRONTIER_POINTS = 100
+
+
+# Returns of a panel ready for the moments: a symbol that did not trade on a date (a stock on a Saturday)
+# has a zero return there, since its next return covers the gap; dates before its first or after its last
+# close stay missing so a late listing does not look like a flat price
+def fill_gaps(returns: pd.DataFrame) -> pd.DataFrame:
+    listed = returns.ffill().notna() & returns.bfill().notna()
+    return returns.fillna(0.0).where(listed)
+
+
+# dates a year in a returns panel, 365 when crypto trades on weekends and about 252 for exchange hours alone;
+# 252 when the panel is too short or has no dates to tell
+def periods_per_year(returns: pd.DataFrame) -> float:
+    if len(returns) < 2 or not isinstance(returns.index, pd.DatetimeIndex):
+        return 252.0
+    years = (returns.index[-1] - returns.index[0]).days / 365.25
+    return (len(returns) - 1) / years if years > 0 else 252.0
+
+
+# annualized mean returns and covariance matrix, the covariance comes from the shared correlation cache
+def moments(returns: pd.DataFrame, periods: float = None):
+    returns = fill_gaps(returns)
+    periods = periods_per_year(returns) if periods is None else periods
+    cov = correlation.matrix(returns, 'cov') * periods
+    mean = returns.mean() * periods
+    # pairs without enough overlapping dates have no covariance, drop the symbol missing the most of them until none is left
+    keep = mean.index[mean.notna()]
+    while len(keep):
+        missing = cov.loc[keep, keep].isna().sum(axis=1)
+        if not missing.any():
+            break
+        keep = keep.drop(missing.idxmax())
+    return mean[keep], cov.loc[keep, keep]
+
+
+# Frontier of fully invested portfolios (weights sum to 1, shorts allowed), every array row is one point
+class Frontier(NamedTuple):
+    returns: np.ndarray
+    volatility: np.ndarray
+    weights: np.ndarray
+    symbols: pd.Index
+    min_variance: pd.Series
+    tangency: pd.Series
+    risk_free: float
+
+    # one row per point with its return, volatility and Sharpe ratio, all annualized
+    def frame(self) -> pd.DataFrame:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (self.returns - self.risk_free) / self.volatility
+        return pd.DataFrame({'Return': self.returns, 'Volatility': self.volatility, 'Sharpe': sharpe})
+
+    # points x symbols weights
+    def weights_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.weights, columns=self.symbols)
+
+
+# Sigma^-1 applied to the columns of right, with a little ridge when the covariance is singular
+# (more symbols than dates, or two symbols that move as one)
+def _solve(cov: np.ndarray, right: np.ndarray) -> np.ndarray:
+    try:
+        return np.linalg.solve(cov, right)
+    except np.linalg.LinAlgError:
+        ridge = 1e-8 * max(np.trace(cov) / len(cov), 1e-12)
+        return np.linalg.solve(cov + ridge * np.eye(len(cov)), right)
+
+
+# The whole frontier in closed form. With A = 1'S^-1 1, B = 1'S^-1 m, C = m'S^-1 m and D = AC - B^2 the
+# minimum variance weights for a target return t are S^-1 (l 1 + g m) with l = (C - Bt) / D and g = (At - B) / D,
+# so one solve of S against [1, m] gives every target at once as an outer product, no solve per point.
+def frontier(mean: pd.Series, cov: pd.DataFrame, points: int = FRONTIER_POINTS, risk_free: float = 0.0, span: float = 1.5) -> Frontier:
+    key = ('frontier', fingerprint(mean), fingerprint(cov), points, risk_free, span)
+    result = correlation.cache.get(key)
+    if result is not None:
+        return result
+    m = mean.to_numpy(dtype='float64')
+    ones = np.ones(len(m))
+    solved = _solve(cov.to_numpy(dtype='float64'), np.column_stack([ones, m]))
+    inverse_ones, inverse_mean = solved[:, 0], solved[:, 1]
+    a, b, c = ones @ inverse_ones, ones @ inverse_mean, m @ inverse_mean
+    d = a * c - b * b
+    # from the minimum variance return up to span times the best single asset
+    low = b / a
+    high = max(m.max(), low) * span if m.max() > 0 else low + abs(low) * span
+    targets = np.linspace(low, max(high, low + 1e-9), points)
+    if d > 1e-12:
+        lam = (c - b * targets) / d
+        gam = (a * targets - b) / d
+        weights = np.outer(lam, inverse_ones) + np.outer(gam, inverse_mean)
+        variance = (a * targets * targets - 2 * b * targets + c) / d
+    else:
+        # every symbol has the same mean, the frontier collapses to the minimum variance portfolio
+        weights = np.tile(inverse_ones / a, (points, 1))
+        variance = np.full(points, 1 / a)
+    volatility = np.sqrt(np.maximum(variance, 0.0))
+    min_variance = pd.Series(inverse_ones / a, index=mean.index, name='Minimum variance')
+    # the tangency portfolio maximizes the Sharpe ratio, weights proportional to S^-1 (m - rf); it only exists
+    # while the risk free rate is below the minimum variance return, otherwise take the best point solved
+    excess = inverse_mean - risk_free * inverse_ones
+    if b - risk_free * a > 1e-12:
+        tangency = excess / excess.sum()
+    else:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tangency = weights[np.nanargmax(np.where(volatility > 0, (targets - risk_free) / volatility, -np.inf))]
+    tangency = pd.Series(tangency, index=mean.index, name='Maximum Sharpe')
+    result = Frontier(targets, volatility, weights, mean.index, min_variance, tangency, risk_free)
+    correlation.cache.put(key, result)
+    return result
+
+
+# Random long-only portfolios drawn uniformly from the simplex, priced in one matrix pass:
+# returns are W m and variances the row sums of (W S) * W
+def random_portfolios(mean: pd.Series, cov: pd.DataFrame, count: int = SIMULATIONS, risk_free: float = 0.0, seed: int = 0) -> pd.DataFrame:
+    key = ('random', fingerprint(mean), fingerprint(cov), count, risk_free, seed)
+    result = correlation.cache.get(key)
+    if result is None:
+        weights = np.random.default_rng(seed).dirichlet(np.ones(len(mean)), size=count)
+        returns = weights @ mean.to_numpy(dtype='float64')
+        volatility = np.sqrt(np.maximum(((weights @ cov.to_numpy(dtype='float64')) * weights).sum(axis=1), 0.0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (returns - risk_free) / volatility
+        result = pd.DataFrame({'Return': returns, 'Volatility': volatility, 'Sharpe': sharpe})
+        correlation.cache.put(key, result)
+    return result
+
+
+# annualized return and volatility of one set of weights, symbols missing from the moments count as zero
+def evaluate(weights: pd.Series, mean: pd.Series, cov: pd.DataFrame):
+    weights = weights.reindex(mean.index, fill_value=0.0).to_numpy(dtype='float64')
+    variance = weights @ cov.to_numpy(dtype='float64') @ weights
+    return float(weights @ mean.to_numpy(dtype='float64')), float(np.sqrt(max(variance, 0.0)))
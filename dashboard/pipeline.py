@@ -0,0 +1,62 @@
+######################
+# Page data pipeline #
+######################
+
+# import libraries
+import asyncio
+import threading
+from concurrent.futures import Future
+
+from dashboard import fundamentals, intraday, price_store
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+# one event loop per process running on a daemon thread, shared by every session
+def _event_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='page-pipeline', daemon=True).start()
+        return _loop
+
+
+# Futures for every piece of data a page needs, each stage starts as soon as its inputs are ready
+# so the page only waits for what the section it is drawing needs
+class PageData:
+
+    def __init__(self, prices: Future, indicators: Future, fields: dict):
+        self.prices = prices
+        self.indicators = indicators
+        self.fields = fields
+
+
+# daily bars come from the price store, intraday bars from the ring buffers of the intraday feed
+async def _load_prices(symbol: str, start_date, end_date, interval: str):
+    if interval == '1d':
+        return await asyncio.to_thread(price_store.download, symbol, start_date, end_date)
+    return await asyncio.to_thread(intraday.download, symbol, start_date, end_date, interval)
+
+
+# indicators only need the prices, so they start the moment the download lands
+async def _compute_indicators(prices: Future, compute):
+    frame = await asyncio.wrap_future(prices)
+    if compute is None:
+        return None
+    high = frame['High'] if 'High' in frame.columns else None
+    low = frame['Low'] if 'Low' in frame.columns else None
+    return await asyncio.to_thread(compute, frame['Close'], high=high, low=low)
+
+
+# start loading the price history, the yf.Ticker fields and the indicators of a symbol all at once,
+# compute is called with the close series (and the high and low as keywords) and its result is what
+# page.indicators resolves to
+def start(symbol: str, start_date, end_date, fields=(), compute=None, interval: str = '1d') -> PageData:
+    loop = _event_loop()
+    # the metadata goes through the fundamentals loader so it shares its thread pool and TTL cache
+    field_futures = fundamentals.load(symbol, fields) if fields else {}
+    prices = asyncio.run_coroutine_threadsafe(_load_prices(symbol, start_date, end_date, interval), loop)
+    indicators = asyncio.run_coroutine_threadsafe(_compute_indicators(prices, compute), loop)
+    return PageData(prices, indicators, field_futures)
@@ -0,0 +1,300 @@
+####################
+# Portfolio engine #
+####################
+
+# import libraries
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard import catalog, price_store
+
+# everything is valued in US dollars
+BASE_CURRENCY = 'USD'
+TRADE_COLUMNS = ['date', 'symbol', 'quantity', 'price']
+# saved trade ledgers, one csv per portfolio
+PORTFOLIO_DIR = os.path.join(price_store.CACHE_DIR, 'portfolios')
+
+
+# the symbol whose close is the dollar value of one unit of a currency: a coin (BTC, ETH, DAI, any currency
+# with a dollar pair in the crypto catalog) uses that pair, fiat uses its yahoo finance exchange rate
+def rate_symbol(currency: str) -> str:
+    pair = catalog.load().info(f'{currency}-{BASE_CURRENCY}')
+    if pair is not None and pair.asset_class == 'crypto':
+        return pair.symbol
+    return f'{currency}{BASE_CURRENCY}=X'
+
+
+# quote currency and asset class of a symbol, symbols missing from the catalog count as dollar stocks
+def _describe(symbol: str):
+    info = catalog.load().info(symbol)
+    if info is None:
+        return BASE_CURRENCY, 'stocks'
+    return info.currency or BASE_CURRENCY, info.asset_class
+
+
+# an empty trade ledger with the expected columns
+def empty_trades() -> pd.DataFrame:
+    return pd.DataFrame({'date': pd.Series(dtype='datetime64[ns]'), 'symbol': pd.Series(dtype=object),
+                         'quantity': pd.Series(dtype='float64'), 'price': pd.Series(dtype='float64')})
+
+
+def _path(name: str) -> str:
+    return os.path.join(PORTFOLIO_DIR, name.replace(os.sep, '_') + '.csv')
+
+
+# the saved trade ledger of a portfolio, or None if it was never saved
+def load_trades(name: str):
+    path = _path(name)
+    if not os.path.exists(path):
+        return None
+    trades = pd.read_csv(path, parse_dates=['date'])
+    return trades.reindex(columns=TRADE_COLUMNS)
+
+
+def save_trades(name: str, trades: pd.DataFrame):
+    os.makedirs(PORTFOLIO_DIR, exist_ok=True)
+    trades.reindex(columns=TRADE_COLUMNS).to_csv(_path(name) + '.tmp', index=False)
+    os.replace(_path(name) + '.tmp', _path(name))
+
+
+# Rows of dates x symbols arrays that grow by doubling, so appending a bar is amortized O(symbols)
+class _Rows:
+
+    def __init__(self, values: np.ndarray):
+        self._values = values
+        self._size = len(values)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[:self._size]
+
+    def last(self) -> np.ndarray:
+        return self._values[self._size - 1]
+
+    def append(self, row):
+        if self._size == len(self._values):
+            grown = np.empty((max(2 * len(self._values), 16),) + self._values.shape[1:], dtype=self._values.dtype)
+            grown[:self._size] = self._values[:self._size]
+            self._values = grown
+        self._values[self._size] = row
+        self._size += 1
+
+
+# Holdings across every asset class built from a trade ledger (date, symbol, quantity, price) and a starting
+# cash balance. Trades are paid from cash at their price, or at the close of their date when the price is
+# missing, and every value is converted to dollars with the close of the quote currency's dollar pair.
+# The history is computed once as dates x symbols arrays; after that each new bar is applied with
+# on_bar in O(symbols) without replaying anything. Trades dated after the last bar wait in the ledger until
+# a bar reaches their date, and a trade with no price and no close to price it at is left out and listed in
+# skipped, a NaN would turn the cash and the net asset value into NaN from that day on.
+class Portfolio:
+
+    def __init__(self, trades: pd.DataFrame, cash: float = 0.0):
+        trades = trades.reindex(columns=TRADE_COLUMNS).dropna(subset=['date', 'symbol', 'quantity'])
+        trades = trades.assign(date=pd.to_datetime(trades['date']).dt.normalize(), symbol=trades['symbol'].str.strip())
+        self.trades = trades[trades['symbol'] != ''].sort_values('date', kind='stable').reset_index(drop=True)
+        self.initial_cash = float(cash)
+        self.symbols = pd.Index(pd.unique(self.trades['symbol']))
+        described = [_describe(symbol) for symbol in self.symbols]
+        self.currencies = np.array([currency for currency, _ in described], dtype=object)
+        self.asset_classes = np.array([asset_class for _, asset_class in described], dtype=object)
+        self._rate_symbols = sorted({rate_symbol(currency) for currency in self.currencies if currency != BASE_CURRENCY})
+        self.dates = pd.DatetimeIndex([])
+        self.skipped = self.trades.iloc[:0]
+        # trades are sorted by date, the first _booked of them are settled
+        self._booked = 0
+        self._quantities = self._prices = self._local = self._rates = self._cash = None
+
+    # closes of the symbols and the currency pairs between two dates, both dates included
+    def _closes(self, start, end) -> pd.DataFrame:
+        symbols = list(self.symbols) + [symbol for symbol in self._rate_symbols if symbol not in self.symbols]
+        frames = price_store.download_many(symbols, start=start, end=end + datetime.timedelta(days=1))
+        closes = {}
+        for symbol, frame in frames.items():
+            if frame.empty:
+                continue
+            close = frame['Close'].dropna()
+            if close.index.tz is not None:
+                close = close.tz_localize(None)
+            # one close a day whatever the exchange's session hours
+            days = close.index.normalize()
+            closes[symbol] = close.groupby(days).last() if days.has_duplicates else close.set_axis(days)
+        return pd.DataFrame(closes).reindex(columns=symbols)
+
+    # dollar rate of every held symbol's quote currency on every row of a closes frame
+    def _rate_matrix(self, closes: pd.DataFrame) -> np.ndarray:
+        rates = np.ones((len(closes), len(self.symbols)))
+        for column, currency in enumerate(self.currencies):
+            if currency != BASE_CURRENCY:
+                rates[:, column] = closes[rate_symbol(currency)].to_numpy(dtype='float64')
+        return rates
+
+    # value the whole ledger from the first trade to end in one vectorized pass
+    def load(self, end=None) -> 'Portfolio':
+        end = pd.Timestamp(end or datetime.date.today()).normalize()
+        self.skipped = self.trades.iloc[:0]
+        due = self.trades[self.trades['date'] <= end]
+        self._booked = len(due)
+        if due.empty:
+            self.dates = pd.DatetimeIndex([])
+            self._empty()
+            return self
+        start = due['date'].min()
+        closes = self._closes(start.date(), end.date())
+        # value every calendar day the portfolio held anything, closes carry over days a market was shut
+        self.dates = pd.date_range(start, end, freq='D')
+        closes = closes.reindex(closes.index.union(self.dates)).ffill().reindex(self.dates)
+        local = closes[list(self.symbols)].to_numpy(dtype='float64')
+        rates = self._rate_matrix(closes)
+        rows = self.dates.get_indexer(due['date'])
+        columns = self.symbols.get_indexer(due['symbol'])
+        # cash pays for every trade at its own price or at the day's close, in dollars
+        # a trade dated before the symbol's first close is priced at that first close
+        first_local = pd.DataFrame(local).bfill().to_numpy()
+        first_rates = pd.DataFrame(rates).bfill().to_numpy()
+        trade_price = due['price'].to_numpy(dtype='float64')
+        trade_price = np.where(np.isnan(trade_price), first_local[rows, columns], trade_price) * first_rates[rows, columns]
+        amounts = due['quantity'].to_numpy(dtype='float64')
+        priced = ~np.isnan(trade_price)
+        self.skipped = due[~priced]
+        # quantities: trades summed per day and symbol, then accumulated down the dates
+        changes = np.zeros((len(self.dates), len(self.symbols)))
+        np.add.at(changes, (rows[priced], columns[priced]), amounts[priced])
+        quantities = np.cumsum(changes, axis=0)
+        spent = np.zeros(len(self.dates))
+        np.add.at(spent, rows[priced], amounts[priced] * trade_price[priced])
+        cash = self.initial_cash - np.cumsum(spent)
+        self._quantities = _Rows(quantities)
+        self._local = _Rows(local)
+        self._rates = _Rows(rates)
+        self._cash = _Rows(cash)
+        return self
+
+    def _empty(self):
+        shape = (0, len(self.symbols))
+        self._quantities, self._local, self._rates = _Rows(np.empty(shape)), _Rows(np.empty(shape)), _Rows(np.empty(shape))
+        self._cash = _Rows(np.empty(0))
+
+    # Apply one new bar: closes is symbol -> close in the quote currency and may include currency pairs,
+    # symbols without a close keep their last one; the ledger trades dated up to this day and the trades
+    # passed in are settled; O(symbols)
+    def on_bar(self, date, closes, trades: pd.DataFrame = None):
+        date = pd.Timestamp(date).normalize()
+        if len(self.dates) and date <= self.dates[-1]:
+            raise ValueError(f'bar {date.date()} is not after the last bar {self.dates[-1].date()}')
+        closes = pd.Series(closes, dtype='float64')
+        local = self._local.last().copy() if len(self._local) else np.full(len(self.symbols), np.nan)
+        rates = self._rates.last().copy() if len(self._rates) else np.ones(len(self.symbols))
+        known = self.symbols.get_indexer(closes.index)
+        local[known[known >= 0]] = closes.to_numpy()[known >= 0]
+        for currency in set(self.currencies) - {BASE_CURRENCY}:
+            rate = closes.get(rate_symbol(currency))
+            if rate is not None and not np.isnan(rate):
+                rates[self.currencies == currency] = rate
+        quantities = self._quantities.last().copy() if len(self._quantities) else np.zeros(len(self.symbols))
+        cash = self._cash.last() if len(self._cash) else self.initial_cash
+        pending = self.trades.iloc[self._booked:]
+        due = pending[pending['date'] <= date]
+        if trades is not None and not trades.empty:
+            trades = trades.reindex(columns=TRADE_COLUMNS).assign(date=date)
+            if (self.symbols.get_indexer(trades['symbol']) < 0).any():
+                raise ValueError('on_bar can only trade symbols the portfolio already holds, rebuild it for new ones')
+            # the new trades go into the ledger after the ones settled so far, before the later dated ones
+            settled = self._booked + len(due)
+            self.trades = pd.concat([self.trades.iloc[:settled], trades, self.trades.iloc[settled:]], ignore_index=True)
+            due = pd.concat([due, trades], ignore_index=True)
+        self._booked += len(due)
+        if len(due):
+            columns = self.symbols.get_indexer(due['symbol'])
+            amounts = due['quantity'].to_numpy(dtype='float64')
+            prices = due['price'].to_numpy(dtype='float64')
+            prices = np.where(np.isnan(prices), local[columns], prices) * rates[columns]
+            priced = ~np.isnan(prices)
+            if not priced.all():
+                self.skipped = pd.concat([self.skipped, due[~priced]], ignore_index=True)
+            np.add.at(quantities, columns[priced], amounts[priced])
+            cash -= float((amounts[priced] * prices[priced]).sum())
+        self._quantities.append(quantities)
+        self._local.append(local)
+        self._rates.append(rates)
+        self._cash.append(cash)
+        self.dates = self.dates.append(pd.DatetimeIndex([date]))
+
+    # pull the bars after the last one from the price store and apply them one by one
+    def refresh(self, end=None) -> int:
+        end = pd.Timestamp(end or datetime.date.today()).normalize()
+        if not len(self.dates):
+            self.load(end)
+            return len(self.dates)
+        first = self.dates[-1] + pd.Timedelta(days=1)
+        if first > end:
+            return 0
+        closes = self._closes(first.date(), end.date())
+        days = pd.date_range(first, end, freq='D')
+        closes = closes.reindex(days)
+        for date, row in closes.iterrows():
+            self.on_bar(date, row.dropna())
+        return len(days)
+
+    # trades of the ledger dated after the last bar, they are settled once a bar reaches their date
+    def pending(self) -> pd.DataFrame:
+        return self.trades.iloc[self._booked:]
+
+    # dollar value of every position on every date, dates x symbols
+    def values(self) -> pd.DataFrame:
+        values = self._quantities.values * np.nan_to_num(self._local.values * self._rates.values)
+        return pd.DataFrame(values, index=self.dates, columns=self.symbols)
+
+    def cash(self) -> pd.Series:
+        return pd.Series(self._cash.values, index=self.dates, name='Cash')
+
+    # net asset value, positions plus cash
+    def nav(self) -> pd.Series:
+        values = self._quantities.values * np.nan_to_num(self._local.values * self._rates.values)
+        return pd.Series(values.sum(axis=1) + self._cash.values, index=self.dates, name='NAV')
+
+    # change of the net asset value from the day before, trades only move value between cash and positions
+    def pnl(self) -> pd.Series:
+        nav = self.nav()
+        return nav.diff().fillna(0.0).rename('P&L')
+
+    def returns(self) -> pd.Series:
+        nav = self.nav()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = self.pnl() / nav.shift(1)
+        return returns.replace([np.inf, -np.inf], np.nan).rename('Return')
+
+    # net dollar exposure of every asset class on every date, dates x asset classes, from one matrix product
+    def exposure(self, gross: bool = False) -> pd.DataFrame:
+        values = self.values().to_numpy()
+        if gross:
+            values = np.abs(values)
+        classes = pd.Index(sorted(set(self.asset_classes)))
+        membership = (self.asset_classes[:, None] == classes.to_numpy()[None, :]).astype('float64')
+        return pd.DataFrame(values @ membership, index=self.dates, columns=classes)
+
+    # latest holdings with their price, value, weight in the net asset value and P&L of the last day
+    def holdings(self) -> pd.DataFrame:
+        if not len(self.dates):
+            return pd.DataFrame(columns=['Asset Class', 'Currency', 'Quantity', 'Price', 'Value', 'Weight %', 'Day P&L'])
+        quantities = self._quantities.values
+        prices = np.nan_to_num(self._local.values * self._rates.values)
+        value = quantities[-1] * prices[-1]
+        day_pnl = quantities[-2] * (prices[-1] - prices[-2]) if len(self.dates) > 1 else np.zeros(len(self.symbols))
+        nav = value.sum() + self._cash.values[-1]
+        table = pd.DataFrame({
+            'Asset Class': self.asset_classes,
+            'Currency': self.currencies,
+            'Quantity': quantities[-1],
+            'Price': self._local.values[-1],
+            'Value': value,
+            'Weight %': value / nav * 100 if nav else np.nan,
+            'Day P&L': day_pnl,
+        }, index=self.symbols)
+        return table[table['Quantity'] != 0]
@@ -0,0 +1,207 @@
+#######################
+# Price history store #
+#######################
+
+# import libraries
+import datetime
+import json
+import os
+import pickle
+import tempfile
+import threading
+from urllib.parse import quote
+
+import pandas as pd
+
+from dashboard.lru import LRUCache
+from dashboard.providers import get_provider
+
+# where the cached price files live, override with the DASHBOARD_CACHE_DIR environment variable
+CACHE_DIR = os.environ.get('DASHBOARD_CACHE_DIR', './.cache')
+# memory the in-memory copies may take before the least recently used symbols are dropped (DASHBOARD_PRICE_CACHE_MB),
+# a dropped symbol is read back from disk on its next use
+MEMORY_BYTES = int(float(os.environ.get('DASHBOARD_PRICE_CACHE_MB', 512)) * 1024 * 1024)
+
+
+# turn a date, datetime, timestamp or string into a plain date
+def _to_date(value) -> datetime.date:
+    return pd.Timestamp(value).date()
+
+
+# keep only the rows between start (inclusive) and end (exclusive), same as yf.download
+def _slice(frame: pd.DataFrame, start: datetime.date, end: datetime.date) -> pd.DataFrame:
+    if frame.empty:
+        return frame.copy()
+    index = frame.index
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_localize(None)
+    # the cached index is sorted, so a binary search finds both edges
+    first = index.searchsorted(pd.Timestamp(start), side='left')
+    last = index.searchsorted(pd.Timestamp(end), side='left')
+    return frame.iloc[first:last].copy()
+
+
+# Store OHLCV history on disk per symbol and interval, and only download the date ranges it does not hold yet.
+# The widest range seen for each symbol is also kept in memory so narrower date ranges are just a slice.
+class PriceStore:
+
+    def __init__(self, root: str = CACHE_DIR, memory_bytes: int = MEMORY_BYTES):
+        self._root = os.path.join(root, 'prices')
+        self._lock = threading.Lock()
+        self._symbol_locks = {}
+        self._memory = LRUCache(memory_bytes)
+
+    # one lock per symbol and interval so different symbols can be fetched at the same time
+    def _symbol_lock(self, symbol: str, interval: str) -> threading.Lock:
+        with self._lock:
+            return self._symbol_locks.setdefault((symbol, interval), threading.Lock())
+
+    # build the data and coverage file paths for a symbol, symbols like EURUSD=X or ^GSPC are escaped
+    def _paths(self, symbol: str, interval: str):
+        name = quote(f'{symbol}_{interval}', safe='')
+        return (
+            os.path.join(self._root, name + '.pkl'),
+            os.path.join(self._root, name + '.json'),
+        )
+
+    # read the cached frame and the date range it covers
+    def _read(self, symbol: str, interval: str):
+        data_path, meta_path = self._paths(symbol, interval)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None, None, None
+        try:
+            frame = pd.read_pickle(data_path)
+            with open(meta_path) as handle:
+                meta = json.load(handle)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            # a broken cache file is just treated as a cache miss
+            return None, None, None
+        return frame, _to_date(meta['start']), _to_date(meta['end'])
+
+    # get the widest cached range for a symbol, from memory first and from disk on the first use in this process
+    def _load(self, symbol: str, interval: str):
+        entry = self._memory.get((symbol, interval))
+        if entry is None:
+            entry = self._read(symbol, interval)
+            if entry[0] is not None:
+                self._memory.put((symbol, interval), entry)
+        return entry
+
+    # write the frame and its coverage, through temporary files so readers never see half a file; every
+    # writer gets its own temporary file, since other processes (screener workers) write the same symbol
+    def _write(self, symbol: str, interval: str, frame: pd.DataFrame, start: datetime.date, end: datetime.date):
+        data_path, meta_path = self._paths(symbol, interval)
+        os.makedirs(self._root, exist_ok=True)
+        data_handle, data_tmp = tempfile.mkstemp(dir=self._root, suffix='.tmp')
+        meta_handle, meta_tmp = tempfile.mkstemp(dir=self._root, suffix='.tmp')
+        try:
+            with os.fdopen(data_handle, 'wb') as handle:
+                pickle.dump(frame, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            with os.fdopen(meta_handle, 'w') as handle:
+                json.dump({'start': start.isoformat(), 'end': end.isoformat()}, handle)
+            os.replace(data_tmp, data_path)
+            os.replace(meta_tmp, meta_path)
+        finally:
+            for path in (data_tmp, meta_tmp):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    # download a date range from the market data provider
+    def _fetch(self, symbol: str, start: datetime.date, end: datetime.date, interval: str) -> pd.DataFrame:
+        return get_provider().history(symbol, start, end, interval)
+
+    # merge newly fetched bars into the cached ones, fresh bars win on overlapping dates
+    @staticmethod
+    def _merge(frames) -> pd.DataFrame:
+        frames = [frame for frame in frames if frame is not None and not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        merged = pd.concat(frames)
+        merged = merged[~merged.index.duplicated(keep='last')]
+        return merged.sort_index()
+
+    # the date ranges a request needs that the cached range does not cover yet
+    @staticmethod
+    def _missing(covered_start, covered_end, start: datetime.date, end: datetime.date) -> list:
+        if covered_start is None:
+            return [(start, end)]
+        missing = []
+        if start < covered_start:
+            missing.append((start, covered_start))
+        if end > covered_end:
+            missing.append((covered_end, end))
+        return missing
+
+    # merge fetched bars over the ranges they came from into the cache, caller holds the symbol lock
+    def _save(self, symbol: str, interval: str, fetched: list, ranges: list) -> pd.DataFrame:
+        # today's bar is still moving, so coverage never extends past today and it is refetched next time
+        today = datetime.date.today()
+        frame, covered_start, covered_end = self._load(symbol, interval)
+        frame = self._merge([frame] + fetched)
+        # an empty answer is also what an error or a rate limit looks like, so it only counts as covered when it is a
+        # head range ending at or before the first bar held: that is the time before the symbol was listed, and asking
+        # for it again would go to the network on every load
+        first = _to_date(frame.index[0]) if not frame.empty else None
+        changed = False
+        for bars, (fetch_start, fetch_end) in zip(fetched, ranges):
+            if bars is None or bars.empty:
+                if first is None or fetch_end > first:
+                    continue
+            fetch_end = min(fetch_end, today)
+            covered_start = fetch_start if covered_start is None else min(covered_start, fetch_start)
+            covered_end = fetch_end if covered_end is None else max(covered_end, fetch_end)
+            changed = True
+        if not changed:
+            return frame
+        self._write(symbol, interval, frame, covered_start, covered_end)
+        self._memory.put((symbol, interval), (frame, covered_start, covered_end))
+        return frame
+
+    # return the bars between start and end, fetching only the missing head and tail of the cached range
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        start, end = _to_date(start), _to_date(end)
+        with self._symbol_lock(symbol, interval):
+            frame, covered_start, covered_end = self._load(symbol, interval)
+            missing = self._missing(covered_start, covered_end, start, end)
+            if missing:
+                fetched = [self._fetch(symbol, fetch_start, fetch_end, interval) for fetch_start, fetch_end in missing]
+                frame = self._save(symbol, interval, fetched, missing)
+        return _slice(frame, start, end)
+
+    # same as history for many symbols, everything not already cached comes from one grouped download
+    def history_many(self, symbols, start, end, interval: str = '1d') -> dict:
+        start, end = _to_date(start), _to_date(end)
+        needed = {}
+        for symbol in symbols:
+            with self._symbol_lock(symbol, interval):
+                missing = self._missing(*self._load(symbol, interval)[1:], start, end)
+            if missing:
+                needed[symbol] = (min(part[0] for part in missing), max(part[1] for part in missing))
+        if needed:
+            # one request wide enough for every symbol, the span always touches the cached range so coverage stays contiguous
+            fetch_start = min(span[0] for span in needed.values())
+            fetch_end = max(span[1] for span in needed.values())
+            fetched = get_provider().history_many(list(needed), fetch_start, fetch_end, interval)
+            for symbol in needed:
+                with self._symbol_lock(symbol, interval):
+                    self._save(symbol, interval, [fetched.get(symbol)], [(fetch_start, fetch_end)])
+        frames = {}
+        for symbol in symbols:
+            with self._symbol_lock(symbol, interval):
+                frame = self._load(symbol, interval)[0]
+            frames[symbol] = _slice(frame if frame is not None else pd.DataFrame(), start, end)
+        return frames
+
+
+# one shared store per process
+store = PriceStore()
+
+
+# drop-in replacement for yf.download(symbol, start=..., end=...) that goes through the store
+def download(symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+    return store.history(symbol, start, end, interval)
+
+
+# batched version of download, returns a dict of symbol -> frame
+def download_many(symbols, start, end, interval: str = '1d') -> dict:
+    return store.history_many(symbols, start, end, interval)
@@ -0,0 +1,262 @@
+#########################
+# Market data providers #
+#########################
+
+# import libraries
+import abc
+import os
+import threading
+from urllib.parse import quote
+
+import pandas as pd
+import yfinance as yf
+
+from dashboard.singleflight import SingleFlight
+
+# pick the provider with DASHBOARD_PROVIDER (yfinance, record or replay) and the fixture folder with DASHBOARD_FIXTURES
+PROVIDER = os.environ.get('DASHBOARD_PROVIDER', 'yfinance')
+FIXTURES_DIR = os.environ.get('DASHBOARD_FIXTURES', './fixtures')
+
+# the yf.Ticker attribute names the pages use, mapped to provider calls
+TICKER_FIELDS = {
+    'recommendations': ('recommendations', None),
+    'institutional_holders': ('holders', 'institutional'),
+    'major_holders': ('holders', 'major'),
+    'financials': ('financials', 'financials'),
+    'balance_sheet': ('financials', 'balance_sheet'),
+    'cashflow': ('financials', 'cashflow'),
+}
+
+
+# raised by the replay provider when nothing was recorded for a request
+class FixtureNotFound(LookupError):
+    pass
+
+
+# Everything the dashboard reads from the market goes through one of these
+class MarketDataProvider(abc.ABC):
+
+    # OHLCV bars between start (inclusive) and end (exclusive)
+    @abc.abstractmethod
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        ...
+
+    # history for many symbols at once as a dict of symbol -> frame, one request per symbol unless overridden
+    def history_many(self, symbols, start, end, interval: str = '1d') -> dict:
+        return {symbol: self.history(symbol, start, end, interval) for symbol in symbols}
+
+    # holders table, kind is 'institutional' or 'major'
+    @abc.abstractmethod
+    def holders(self, symbol: str, kind: str) -> pd.DataFrame:
+        ...
+
+    # financial statement, statement is 'financials', 'balance_sheet' or 'cashflow'
+    @abc.abstractmethod
+    def financials(self, symbol: str, statement: str) -> pd.DataFrame:
+        ...
+
+    # analyst buy and sell recommendations
+    @abc.abstractmethod
+    def recommendations(self, symbol: str) -> pd.DataFrame:
+        ...
+
+    # look up a yf.Ticker style attribute name such as 'major_holders'
+    def field(self, symbol: str, field: str):
+        method, argument = TICKER_FIELDS[field]
+        if argument is None:
+            return getattr(self, method)(symbol)
+        return getattr(self, method)(symbol, argument)
+
+
+# Live data from yahoo finance
+class YFinanceProvider(MarketDataProvider):
+
+    # newer yfinance versions label a single symbol download with (field, ticker) columns, drop the ticker so the
+    # frame has the same shape as the ones history_many splits out, both land in the same price store file
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        data = yf.download(symbol, start=start, end=end, interval=interval, progress=False)
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+        return data
+
+    # a single grouped download for every symbol, split back into one frame per symbol
+    def history_many(self, symbols, start, end, interval: str = '1d') -> dict:
+        symbols = list(symbols)
+        data = yf.download(
+            symbols, start=start, end=end, interval=interval, group_by='ticker', threads=True, progress=False
+        )
+        if not isinstance(data.columns, pd.MultiIndex):
+            return {symbols[0]: data}
+        frames = {}
+        for symbol in symbols:
+            if symbol in data.columns.get_level_values(0):
+                # the grouped frame uses the union of every calendar, so drop the dates this symbol did not trade
+                frames[symbol] = data[symbol].dropna(how='all')
+            else:
+                frames[symbol] = pd.DataFrame()
+        return frames
+
+    def holders(self, symbol: str, kind: str) -> pd.DataFrame:
+        return getattr(yf.Ticker(symbol), f'{kind}_holders')
+
+    def financials(self, symbol: str, statement: str) -> pd.DataFrame:
+        return getattr(yf.Ticker(symbol), statement)
+
+    def recommendations(self, symbol: str) -> pd.DataFrame:
+        return yf.Ticker(symbol).recommendations
+
+
+# read and write fixture files, one pickle per symbol and request
+class _FixtureFiles:
+
+    def __init__(self, root: str):
+        self._root = root
+
+    def path(self, symbol: str, *key) -> str:
+        name = quote('_'.join((symbol,) + tuple(str(part) for part in key)), safe='')
+        return os.path.join(self._root, name + '.pkl')
+
+    def read(self, symbol: str, *key):
+        path = self.path(symbol, *key)
+        if not os.path.exists(path):
+            raise FixtureNotFound(f'no fixture recorded for {symbol} {key}')
+        return pd.read_pickle(path)
+
+    def write(self, value, symbol: str, *key):
+        path = self.path(symbol, *key)
+        os.makedirs(self._root, exist_ok=True)
+        pd.to_pickle(value, path + '.tmp')
+        os.replace(path + '.tmp', path)
+
+
+# Pass every request through to another provider and save the answers as fixtures
+class RecordingProvider(MarketDataProvider):
+
+    def __init__(self, inner: MarketDataProvider, root: str = FIXTURES_DIR):
+        self._inner = inner
+        self._files = _FixtureFiles(root)
+        self._lock = threading.Lock()
+
+    # history fixtures hold every bar recorded for a symbol so any date range can be replayed from them
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        frame = self._inner.history(symbol, start, end, interval)
+        self._record_history(symbol, interval, frame)
+        return frame
+
+    def history_many(self, symbols, start, end, interval: str = '1d') -> dict:
+        frames = self._inner.history_many(symbols, start, end, interval)
+        for symbol, frame in frames.items():
+            self._record_history(symbol, interval, frame)
+        return frames
+
+    # add bars to the history fixture of a symbol
+    def _record_history(self, symbol: str, interval: str, frame: pd.DataFrame):
+        with self._lock:
+            try:
+                recorded = self._files.read(symbol, 'history', interval)
+                recorded = pd.concat([recorded, frame])
+                recorded = recorded[~recorded.index.duplicated(keep='last')].sort_index()
+            except FixtureNotFound:
+                recorded = frame
+            self._files.write(recorded, symbol, 'history', interval)
+
+    def holders(self, symbol: str, kind: str) -> pd.DataFrame:
+        value = self._inner.holders(symbol, kind)
+        self._files.write(value, symbol, 'holders', kind)
+        return value
+
+    def financials(self, symbol: str, statement: str) -> pd.DataFrame:
+        value = self._inner.financials(symbol, statement)
+        self._files.write(value, symbol, 'financials', statement)
+        return value
+
+    def recommendations(self, symbol: str) -> pd.DataFrame:
+        value = self._inner.recommendations(symbol)
+        self._files.write(value, symbol, 'recommendations')
+        return value
+
+
+# Serve recorded fixtures from disk without touching the network
+class ReplayProvider(MarketDataProvider):
+
+    def __init__(self, root: str = FIXTURES_DIR):
+        self._files = _FixtureFiles(root)
+
+    # a symbol that was never recorded gets an empty frame, the same answer yahoo finance gives for an unknown
+    # symbol, so one gap in the fixtures does not fail a whole batch
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        try:
+            frame = self._files.read(symbol, 'history', interval)
+        except FixtureNotFound:
+            return pd.DataFrame()
+        index = frame.index
+        if getattr(index, 'tz', None) is not None:
+            index = index.tz_localize(None)
+        mask = (index >= pd.Timestamp(start)) & (index < pd.Timestamp(end))
+        return frame[mask].copy()
+
+    def holders(self, symbol: str, kind: str) -> pd.DataFrame:
+        return self._files.read(symbol, 'holders', kind)
+
+    def financials(self, symbol: str, statement: str) -> pd.DataFrame:
+        return self._files.read(symbol, 'financials', statement)
+
+    def recommendations(self, symbol: str) -> pd.DataFrame:
+        return self._files.read(symbol, 'recommendations')
+
+
+# Share one in-flight request between every session asking another provider the same thing at the same time
+class CoalescingProvider(MarketDataProvider):
+
+    def __init__(self, inner: MarketDataProvider):
+        self._inner = inner
+        self._flight = SingleFlight()
+
+    def history(self, symbol: str, start, end, interval: str = '1d') -> pd.DataFrame:
+        key = ('history', symbol, str(start), str(end), interval)
+        return self._flight.do(key, self._inner.history, symbol, start, end, interval)
+
+    def history_many(self, symbols, start, end, interval: str = '1d') -> dict:
+        symbols = tuple(symbols)
+        key = ('history_many', symbols, str(start), str(end), interval)
+        return self._flight.do(key, self._inner.history_many, symbols, start, end, interval)
+
+    def holders(self, symbol: str, kind: str) -> pd.DataFrame:
+        return self._flight.do(('holders', symbol, kind), self._inner.holders, symbol, kind)
+
+    def financials(self, symbol: str, statement: str) -> pd.DataFrame:
+        return self._flight.do(('financials', symbol, statement), self._inner.financials, symbol, statement)
+
+    def recommendations(self, symbol: str) -> pd.DataFrame:
+        return self._flight.do(('recommendations', symbol), self._inner.recommendations, symbol)
+
+
+# build the provider named by DASHBOARD_PROVIDER
+def _default_provider() -> MarketDataProvider:
+    if PROVIDER == 'replay':
+        return ReplayProvider()
+    if PROVIDER == 'record':
+        return RecordingProvider(YFinanceProvider())
+    if PROVIDER == 'yfinance':
+        return YFinanceProvider()
+    raise ValueError('DASHBOARD_PROVIDER should be "yfinance", "record" or "replay"')
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+# the provider every data loader in the dashboard goes through
+def get_provider() -> MarketDataProvider:
+    global _provider
+    # sessions run on their own threads, so make sure only one of them builds the shared provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = CoalescingProvider(_default_provider())
+        return _provider
+
+
+# swap the provider, e.g. a ReplayProvider for benchmarks and load tests
+def set_provider(provider: MarketDataProvider):
+    global _provider
+    _provider = provider
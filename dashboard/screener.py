@@ -0,0 +1,130 @@
+######################
+# Technical screener #
+######################
+
+# import libraries
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed as _as_completed
+
+import numpy as np
+import pandas as pd
+
+from dashboard import columnar, price_store
+from dashboard.indicators import MACD, BollingerBands, RSIIndicator
+
+# default RSI levels, symbols per task and worker processes (DASHBOARD_SCREENER_WORKERS, all cores by default)
+RSI_OVERSOLD = 30
+RSI_OVERBOUGHT = 70
+CHUNK_SIZE = int(os.environ.get('DASHBOARD_SCREENER_CHUNK', 100))
+WORKERS = int(os.environ.get('DASHBOARD_SCREENER_WORKERS', 0)) or os.cpu_count() or 1
+COLUMNS = ['Close', 'Change %', 'RSI', 'RSI Signal', 'Bollinger', 'MACD Cross', 'Signals']
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+# one pool of worker processes, shared by every session; spawned rather than forked because
+# the parent runs threads (the page pipeline, the cache warmer) that a fork would copy mid-flight
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+# Closes of a chunk as symbol -> series. With a columnar store they are read from its memory map, which
+# every worker shares through the page cache; symbols it does not hold come from one grouped download.
+def _closes(symbols, start, end, store_root: str = None) -> dict:
+    closes = {}
+    store = columnar.open_store(store_root) if store_root else None
+    if store is not None:
+        held = [symbol for symbol in symbols if symbol in store.symbols]
+        panel = store.panel('Close', held, start, end)
+        closes = {symbol: panel[symbol] for symbol in held}
+        symbols = [symbol for symbol in symbols if symbol not in closes]
+    if symbols:
+        frames = price_store.download_many(symbols, start=start, end=end)
+        closes.update({symbol: frame['Close'] for symbol, frame in frames.items() if not frame.empty})
+    return closes
+
+
+# Every symbol's closes without its missing bars, stacked so they all end on the last row: the indicators then
+# run once over the panel and still see each symbol on its own calendar, as if it ran on its own, with no
+# gap from another symbol's trading days (a stock's weekends next to crypto) breaking its windows
+def stack(closes: dict) -> pd.DataFrame:
+    columns = {symbol: close.dropna().to_numpy(dtype='float64') for symbol, close in closes.items()}
+    columns = {symbol: values for symbol, values in columns.items() if len(values)}
+    if not columns:
+        return pd.DataFrame()
+    length = max(len(values) for values in columns.values())
+    panel = np.full((length, len(columns)), np.nan)
+    for column, values in enumerate(columns.values()):
+        panel[length - len(values):, column] = values
+    return pd.DataFrame(panel, columns=list(columns))
+
+
+# Screen one chunk of symbols, runs in a worker process. The closes of the chunk come from the columnar
+# store or one grouped download and every indicator runs once over the stacked panel; the last row is
+# each symbol's own latest bar, so symbols that stopped trading early are still screened on their last close.
+def screen_chunk(symbols, start, end, rsi_low: float = RSI_OVERSOLD, rsi_high: float = RSI_OVERBOUGHT, store_root: str = None) -> pd.DataFrame:
+    panel = stack(_closes(symbols, start, end, store_root))
+    if panel.empty:
+        return pd.DataFrame(columns=COLUMNS)
+    shared = {}
+    bands = BollingerBands(panel, shared=shared)
+    outputs = {
+        'close': panel.to_numpy(dtype='float64'),
+        'rsi': RSIIndicator(panel, shared=shared).rsi().to_numpy(),
+        'above': bands.bollinger_hband_indicator().to_numpy(),
+        'below': bands.bollinger_lband_indicator().to_numpy(),
+        'macd_diff': MACD(panel, shared=shared).macd_diff().to_numpy(),
+    }
+    latest = {name: values[-1] for name, values in outputs.items()}
+    # the bar before on the symbol's own calendar, NaN for a symbol with a single bar
+    close_before = outputs['close'][-2] if len(panel) > 1 else np.full(panel.shape[1], np.nan)
+    diff_before = outputs['macd_diff'][-2] if len(panel) > 1 else np.full(panel.shape[1], np.nan)
+
+    rsi_signal = np.where(latest['rsi'] <= rsi_low, 'Oversold', np.where(latest['rsi'] >= rsi_high, 'Overbought', ''))
+    bollinger = np.where(latest['above'] == 1, 'Above', np.where(latest['below'] == 1, 'Below', 'Inside'))
+    # the MACD line crossing its signal line is the histogram changing sign
+    macd_cross = np.where(
+        (diff_before <= 0) & (latest['macd_diff'] > 0), 'Bullish',
+        np.where((diff_before >= 0) & (latest['macd_diff'] < 0), 'Bearish', ''),
+    )
+    result = pd.DataFrame({
+        'Close': latest['close'],
+        'Change %': (latest['close'] / close_before - 1) * 100,
+        'RSI': latest['rsi'],
+        'RSI Signal': rsi_signal,
+        'Bollinger': bollinger,
+        'MACD Cross': macd_cross,
+    }, index=panel.columns)
+    result['Signals'] = (rsi_signal != '').astype(int) + (bollinger != 'Inside').astype(int) + (macd_cross != '').astype(int)
+    return result
+
+
+# most signals first, then the most extreme RSI
+def rank(results: pd.DataFrame) -> pd.DataFrame:
+    if results.empty:
+        return results
+    extremity = (results['RSI'] - 50).abs()
+    order = np.lexsort((-extremity.fillna(0).to_numpy(), -results['Signals'].to_numpy()))
+    return results.iloc[order]
+
+
+# Fan a universe out over the worker processes in chunks and yield (symbols, frame, error) for every
+# chunk in the order they finish, so a page can show ranked results while the rest are still running
+def screen(symbols, start, end, chunk_size: int = CHUNK_SIZE, rsi_low: float = RSI_OVERSOLD, rsi_high: float = RSI_OVERBOUGHT, store_root: str = None):
+    symbols = list(symbols)
+    executor = _executor()
+    chunks = {}
+    for first in range(0, len(symbols), chunk_size):
+        chunk = symbols[first:first + chunk_size]
+        chunks[executor.submit(screen_chunk, chunk, start, end, rsi_low, rsi_high, store_root)] = chunk
+    for future in _as_completed(chunks):
+        error = future.exception()
+        yield chunks[future], (None if error else future.result()), error
@@ -0,0 +1,43 @@
+#######################
+# Single-flight calls #
+#######################
+
+# import libraries
+import threading
+from concurrent.futures import Future
+
+
+# Run a call once per key at a time, callers that ask for the same key while it is running
+# wait for that call and share its result (or its exception) instead of starting their own
+class SingleFlight:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    # call fn(*args, **kwargs) unless a call with the same key is already in flight
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    # number of calls currently in flight
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,222 @@
+########################
+# Streaming indicators #
+########################
+
+# import libraries
+import abc
+import copy
+import math
+from collections import deque
+
+import pandas as pd
+
+NAN = float("nan")
+
+
+# Every streaming indicator keeps just enough state to turn one new close into its next value,
+# seed() replays a history through update() so the state lines up with the batch classes
+class StreamingIndicator(abc.ABC):
+
+    @abc.abstractmethod
+    def update(self, close: float) -> float:
+        ...
+
+    # feed a history one bar at a time and return the last value
+    def seed(self, close: pd.Series) -> float:
+        value = NAN
+        for price in close.to_numpy(dtype="float64"):
+            value = self.update(float(price))
+        return value
+
+
+# Exponential moving average with adjust=False, the same recursion and NaN handling as pandas ewm
+class StreamingEMA(StreamingIndicator):
+
+    def __init__(self, span: float = None, alpha: float = None, min_periods: int = 0):
+        self._alpha = 2.0 / (span + 1.0) if alpha is None else alpha
+        self._factor = 1.0 - self._alpha
+        self._min_periods = max(min_periods, 1)
+        self._weighted = NAN
+        self._old_wt = 1.0
+        self._nobs = 0
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        observed = not math.isnan(close)
+        self._nobs += observed
+        if not math.isnan(self._weighted):
+            # a missing bar still decays the old weight, like ignore_na=False
+            self._old_wt *= self._factor
+            if observed:
+                if self._weighted != close:
+                    self._weighted = (self._old_wt * self._weighted + self._alpha * close) / (self._old_wt + self._alpha)
+                self._old_wt = 1.0
+        elif observed:
+            self._weighted = close
+        self.value = self._weighted if self._nobs >= self._min_periods else NAN
+        return self.value
+
+
+# Bollinger Bands over a fixed window, mean and variance are slid with Welford-style updates
+class StreamingBollinger(StreamingIndicator):
+
+    def __init__(self, window: int = 20, window_dev: int = 2):
+        self._window = window
+        self._window_dev = window_dev
+        self._values = deque(maxlen=window)
+        self._missing = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.mavg = self.hband = self.lband = NAN
+
+    # rebuild the running mean and squared deviations from the window, only after a NaN left it
+    def _recompute(self):
+        self._mean = sum(self._values) / len(self._values)
+        self._m2 = sum((value - self._mean) ** 2 for value in self._values)
+
+    def update(self, close: float) -> float:
+        full = len(self._values) == self._window
+        oldest = self._values[0] if full else None
+        self._values.append(close)
+        self._missing += math.isnan(close) - (oldest is not None and math.isnan(oldest))
+        if self._missing:
+            self.mavg = self.hband = self.lband = NAN
+            return self.mavg
+        if oldest is None:
+            # still filling the window, plain Welford
+            delta = close - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (close - self._mean)
+        elif math.isnan(oldest):
+            self._recompute()
+        else:
+            # swap the oldest value for the new one in a single step
+            old_mean = self._mean
+            self._mean += (close - oldest) / self._window
+            self._m2 += (close - oldest) * (close - self._mean + oldest - old_mean)
+        if len(self._values) < self._window:
+            self.mavg = self.hband = self.lband = NAN
+            return self.mavg
+        std = math.sqrt(max(self._m2 / self._window, 0.0))
+        self.mavg = self._mean
+        self.hband = self._mean + self._window_dev * std
+        self.lband = self._mean - self._window_dev * std
+        return self.mavg
+
+
+# Relative Strength Index with Wilder smoothing of the gains and losses
+class StreamingRSI(StreamingIndicator):
+
+    def __init__(self, window: int = 14):
+        self._previous = NAN
+        self._started = False
+        self._up = StreamingEMA(alpha=1 / window, min_periods=window)
+        self._down = StreamingEMA(alpha=1 / window, min_periods=window)
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        diff = close - self._previous
+        self._previous = close
+        # bars before the first close count for nothing, like the started mask of the batch class; from the
+        # first close on a bar without a change counts as neither a gain nor a loss, like diff.where(...)
+        self._started = self._started or not math.isnan(close)
+        if self._started:
+            up = self._up.update(diff if diff > 0 else 0.0)
+            down = self._down.update(-diff if diff < 0 else 0.0)
+        else:
+            up = self._up.update(NAN)
+            down = self._down.update(NAN)
+        if down == 0:
+            self.value = 100.0
+        else:
+            self.value = 100 - (100 / (1 + up / down))
+        return self.value
+
+
+# MACD line, signal line and histogram
+class StreamingMACD(StreamingIndicator):
+
+    def __init__(self, window_slow: int = 26, window_fast: int = 12, window_sign: int = 9):
+        self._fast = StreamingEMA(span=window_fast, min_periods=window_fast)
+        self._slow = StreamingEMA(span=window_slow, min_periods=window_slow)
+        self._signal = StreamingEMA(span=window_sign, min_periods=window_sign)
+        self.macd = self.macd_signal = self.macd_diff = NAN
+
+    def update(self, close: float) -> float:
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.macd_signal = self._signal.update(self.macd)
+        self.macd_diff = self.macd - self.macd_signal
+        return self.macd
+
+
+# True Strength Index, a double smoothed momentum and its double smoothed absolute value
+class StreamingTSI(StreamingIndicator):
+
+    def __init__(self, window_slow: int = 25, window_fast: int = 13):
+        self._previous = NAN
+        self._slow = StreamingEMA(span=window_slow, min_periods=window_slow)
+        self._fast = StreamingEMA(span=window_fast, min_periods=window_fast)
+        self._slow_abs = StreamingEMA(span=window_slow, min_periods=window_slow)
+        self._fast_abs = StreamingEMA(span=window_fast, min_periods=window_fast)
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        diff = close - self._previous
+        self._previous = close
+        smoothed = self._fast.update(self._slow.update(diff))
+        smoothed_abs = self._fast_abs.update(self._slow_abs.update(abs(diff)))
+        self.value = smoothed / smoothed_abs * 100 if smoothed_abs else NAN
+        return self.value
+
+
+# Rate of Change against the close a fixed number of bars ago
+class StreamingROC(StreamingIndicator):
+
+    def __init__(self, window: int = 12):
+        self._closes = deque(maxlen=window + 1)
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        self._closes.append(close)
+        if len(self._closes) <= self._closes.maxlen - 1:
+            self.value = NAN
+        else:
+            shifted = self._closes[0]
+            self.value = ((close - shifted) / shifted) * 100 if shifted else NAN
+        return self.value
+
+
+# The indicators the pages draw, kept up to date together from one close per bar
+class StreamingSet:
+
+    def __init__(self):
+        self._bollinger = StreamingBollinger()
+        self._rsi = StreamingRSI()
+        self._macd = StreamingMACD()
+        self._tsi = StreamingTSI()
+        self._roc = StreamingROC()
+
+    # latest value of every output, named like the outputs of indicators.compute_all
+    def values(self) -> dict:
+        return {
+            'Bollinger_Band_High': self._bollinger.hband,
+            'Bollinger_Band_Low': self._bollinger.lband,
+            'macd': self._macd.macd,
+            'rsi': self._rsi.value,
+            'tsi': self._tsi.value,
+            'roc': self._roc.value,
+        }
+
+    def update(self, close: float) -> dict:
+        for indicator in (self._bollinger, self._rsi, self._macd, self._tsi, self._roc):
+            indicator.update(close)
+        return self.values()
+
+    def seed(self, close: pd.Series) -> dict:
+        for price in close.to_numpy(dtype="float64"):
+            self.update(float(price))
+        return self.values()
+
+    # values with a bar that is still forming, the state itself only ever takes closed bars
+    def preview(self, close: float) -> dict:
+        return copy.deepcopy(self).update(close)
@@ -0,0 +1,134 @@
+###################
+# Parameter sweep #
+###################
+
+# import libraries
+import itertools
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from dashboard.indicators import SeriesOrPanel, _panel_ewm, _panel_rolling, _rolling_sums
+
+BOLLINGER_OUTPUTS = ('mavg', 'hband', 'lband', 'wband', 'pband')
+MACD_OUTPUTS = ('macd', 'macd_signal', 'macd_diff')
+
+
+# A whole parameter grid of one indicator output, values is dates x symbols x parameter sets
+class Sweep(NamedTuple):
+    values: np.ndarray
+    dates: pd.Index
+    symbols: pd.Index
+    params: list
+
+    # dates x symbols frame of one parameter set, picked by position or by its parameters
+    def frame(self, params) -> pd.DataFrame:
+        position = params if isinstance(params, int) else self.params.index(params)
+        return pd.DataFrame(self.values[:, :, position], index=self.dates, columns=self.symbols)
+
+    # dates x parameter sets frame of one symbol, columns labelled like 'window=14'
+    def symbol(self, symbol) -> pd.DataFrame:
+        labels = [','.join(f'{name}={value}' for name, value in params.items()) for params in self.params]
+        column = self.symbols.get_loc(symbol)
+        return pd.DataFrame(self.values[:, column, :], index=self.dates, columns=labels)
+
+
+# a close series is swept as a panel of one symbol
+def _panel(close: SeriesOrPanel) -> pd.DataFrame:
+    if isinstance(close, pd.Series):
+        return close.to_frame(close.name if close.name is not None else 'Close')
+    return close
+
+
+# EMAs of every column for several spans in one pass over the dates, the columns are repeated once per span
+# and run side by side through the panel kernel; returns dates x symbols x spans
+def _stacked_ema(values: np.ndarray, spans, min_periods=None) -> np.ndarray:
+    spans = np.asarray(spans, dtype='float64')
+    min_periods = spans if min_periods is None else np.asarray(min_periods, dtype='float64')
+    dates, symbols = values.shape
+    stacked = np.repeat(values[:, :, np.newaxis], len(spans), axis=2).reshape(dates, symbols * len(spans))
+    alphas = np.tile(2.0 / (spans + 1.0), symbols)
+    output = _panel_ewm(stacked, alphas, np.tile(min_periods, symbols))
+    return output.reshape(dates, symbols, len(spans))
+
+
+# Wilder smoothing of several windows at once, alpha is 1 / window
+def _stacked_wilder(values: np.ndarray, windows) -> np.ndarray:
+    windows = np.asarray(windows, dtype='float64')
+    dates, symbols = values.shape
+    stacked = np.repeat(values[:, :, np.newaxis], len(windows), axis=2).reshape(dates, symbols * len(windows))
+    output = _panel_ewm(stacked, np.tile(1.0 / windows, symbols), np.tile(windows, symbols))
+    return output.reshape(dates, symbols, len(windows))
+
+
+# RSI of every window, the same numbers as RSIIndicator(close, window).rsi()
+def rsi(close: SeriesOrPanel, windows=range(2, 51)) -> Sweep:
+    panel = _panel(close)
+    windows = list(windows)
+    diff = panel.diff(1).to_numpy(dtype='float64')
+    # a missing diff counts as no change like diff.where(diff > 0, 0.0), except before a symbol's first close
+    started = np.maximum.accumulate(panel.notna().to_numpy(), axis=0)
+    up_direction = np.where(started, np.where(diff > 0, diff, 0.0), np.nan)
+    down_direction = np.where(started, np.where(diff < 0, -diff, 0.0), np.nan)
+    emaup = _stacked_wilder(up_direction, windows)
+    emadn = _stacked_wilder(down_direction, windows)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = np.where(emadn == 0, 100, 100 - (100 / (1 + emaup / emadn)))
+    return Sweep(values, panel.index, panel.columns, [{'window': window} for window in windows])
+
+
+# Bollinger Bands of every window and deviation, the rolling sums are taken once and every window is
+# read off them; output is one of BOLLINGER_OUTPUTS and matches the BollingerBands method of that name
+def bollinger(close: SeriesOrPanel, windows=(10, 20, 30), window_devs=(1.5, 2, 2.5), output: str = 'hband') -> Sweep:
+    if output not in BOLLINGER_OUTPUTS:
+        raise ValueError(f'unknown Bollinger output {output!r}, expected one of {BOLLINGER_OUTPUTS}')
+    panel = _panel(close)
+    values = panel.to_numpy(dtype='float64')
+    running = _rolling_sums(values)
+    params = list(itertools.product(windows, window_devs))
+    result = np.empty(values.shape + (len(params),))
+    rolling = {}
+    for position, (window, window_dev) in enumerate(params):
+        if window not in rolling:
+            rolling[window] = _panel_rolling(values, window, running)
+        mavg, mstd = rolling[window]
+        hband = mavg + window_dev * mstd
+        lband = mavg - window_dev * mstd
+        if output == 'mavg':
+            result[:, :, position] = mavg
+        elif output == 'hband':
+            result[:, :, position] = hband
+        elif output == 'lband':
+            result[:, :, position] = lband
+        elif output == 'wband':
+            result[:, :, position] = ((hband - lband) / mavg) * 100
+        else:
+            result[:, :, position] = (values - lband) / (hband - lband)
+    return Sweep(result, panel.index, panel.columns, [{'window': window, 'window_dev': window_dev} for window, window_dev in params])
+
+
+# MACD of every fast, slow and signal combination with fast < slow; each distinct span is smoothed once,
+# and every signal line of every combination runs in a second stacked pass; output is one of MACD_OUTPUTS
+def macd(close: SeriesOrPanel, windows_fast=(8, 12, 16), windows_slow=(21, 26, 34), windows_sign=(5, 9), output: str = 'macd') -> Sweep:
+    if output not in MACD_OUTPUTS:
+        raise ValueError(f'unknown MACD output {output!r}, expected one of {MACD_OUTPUTS}')
+    panel = _panel(close)
+    values = panel.to_numpy(dtype='float64')
+    spans = sorted(set(windows_fast) | set(windows_slow))
+    emas = _stacked_ema(values, spans)
+    lines = [(fast, slow) for fast in windows_fast for slow in windows_slow if fast < slow]
+    macd_lines = np.stack([emas[:, :, spans.index(fast)] - emas[:, :, spans.index(slow)] for fast, slow in lines], axis=2)
+    params = [{'window_fast': fast, 'window_slow': slow, 'window_sign': sign} for fast, slow in lines for sign in windows_sign]
+    result = np.repeat(macd_lines, len(windows_sign), axis=2)
+    if output != 'macd':
+        dates, symbols, count = result.shape
+        signs = np.tile(np.asarray(windows_sign, dtype='float64'), len(lines))
+        # one column per symbol and parameter set, each with its own signal span
+        signal = _panel_ewm(
+            result.reshape(dates, symbols * count),
+            np.tile(2.0 / (signs + 1.0), symbols),
+            np.tile(signs, symbols),
+        ).reshape(dates, symbols, count)
+        result = signal if output == 'macd_signal' else result - signal
+    return Sweep(result, panel.index, panel.columns, params)
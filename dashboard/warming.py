@@ -0,0 +1,111 @@
+########################
+# Cache warming thread #
+########################
+
+# import libraries
+import datetime
+import logging
+import os
+import threading
+
+from dashboard import indicator_cache, indicators, price_store
+
+logger = logging.getLogger(__name__)
+
+# how many symbols of each universe to keep warm, seconds between rounds, symbols per grouped request,
+# seconds to wait between requests so we stay under the yahoo finance rate limits, and days of history to keep
+WARM_TOP_N = int(os.environ.get('DASHBOARD_WARM_TOP_N', 25))
+WARM_INTERVAL = float(os.environ.get('DASHBOARD_WARM_INTERVAL', 15 * 60))
+WARM_BATCH = int(os.environ.get('DASHBOARD_WARM_BATCH', 10))
+WARM_PAUSE = float(os.environ.get('DASHBOARD_WARM_PAUSE', 2.0))
+WARM_DAYS = int(os.environ.get('DASHBOARD_WARM_DAYS', 730))
+
+
+# Periodically prefetch the history of the first symbols of every registered universe
+# and the indicators its page charts, so the first click on a popular symbol does no downloading and no arithmetic
+class CacheWarmer:
+
+    def __init__(self, top_n: int = WARM_TOP_N, interval: float = WARM_INTERVAL,
+                 batch: int = WARM_BATCH, pause: float = WARM_PAUSE, days: int = WARM_DAYS):
+        self._top_n = top_n
+        self._interval = interval
+        self._batch = batch
+        self._pause = pause
+        self._days = days
+        self._universes = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # add or replace a universe, only its first top_n symbols are warmed and only with the specs its page charts
+    def register(self, name: str, symbols, specs: dict = indicators.PAGE_SPECS):
+        with self._lock:
+            self._universes[name] = (list(symbols)[:self._top_n], specs)
+
+    # the symbols that will be warmed on the next round
+    def symbols(self) -> list:
+        with self._lock:
+            universes = list(self._universes.values())
+        seen = []
+        for symbols, _ in universes:
+            seen.extend(symbol for symbol in symbols if symbol not in seen)
+        return seen
+
+    # the specs of every universe a symbol is in, a symbol on two pages is warmed for both
+    def specs(self, symbol: str) -> dict:
+        with self._lock:
+            universes = list(self._universes.values())
+        merged = {}
+        for symbols, specs in universes:
+            if symbol in symbols:
+                merged.update(specs)
+        return merged
+
+    # fetch every registered symbol once, in throttled grouped batches
+    def warm_once(self):
+        end = datetime.date.today()
+        start = end - datetime.timedelta(days=self._days)
+        symbols = self.symbols()
+        for first in range(0, len(symbols), self._batch):
+            if self._stop.is_set():
+                return
+            batch = symbols[first:first + self._batch]
+            try:
+                frames = price_store.download_many(batch, start=start, end=end)
+                # the pages default to the same window, so their prices hash to these entries
+                for symbol, frame in frames.items():
+                    if not frame.empty:
+                        indicator_cache.compute_all(
+                            frame['Close'], self.specs(symbol), high=frame['High'], low=frame['Low']
+                        )
+            except Exception:
+                # a failed batch is retried on the next round
+                logger.exception('cache warming failed for %s', batch)
+            self._stop.wait(self._pause)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.warm_once()
+            self._stop.wait(self._interval)
+
+    # start the background thread once per process
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='cache-warmer', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+# one warmer per process, shared by every page
+warmer = CacheWarmer()
+
+
+# register a page universe with the specs the page charts and make sure the warmer is running
+def ensure_started(name: str, symbols, specs: dict = indicators.PAGE_SPECS):
+    warmer.register(name, symbols, specs)
+    warmer.start()
@@ -0,0 +1,69 @@
+##################
+# Watchlist view #
+##################
+
+# import libraries
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard import catalog, price_store
+from dashboard.indicator_cache import compute_all
+from dashboard.screener import stack
+
+# the latest value of these outputs goes into the summary table
+SUMMARY_SPECS = {
+    'Bollinger_Band_High': ('bollinger', 'bollinger_hband', {}),
+    'Bollinger_Band_Low': ('bollinger', 'bollinger_lband', {}),
+    'RSI': ('rsi', 'rsi', {}),
+    'MACD': ('macd', 'macd', {}),
+    'TSI': ('tsi', 'tsi', {}),
+    'ROC': ('roc', 'roc', {}),
+}
+
+
+# Line up the closing prices of every symbol into one panel, each symbol on its own calendar and ending on
+# the last row (see screener.stack), so one indicator pass over the panel gives every symbol the values it
+# would get on its own
+def close_panel(frames: dict) -> pd.DataFrame:
+    return stack({symbol: frame['Close'] for symbol, frame in frames.items() if not frame.empty})
+
+
+# build one summary row per symbol with the latest value of each page indicator, all symbols in one batched compute
+def summary_table(frames: dict) -> pd.DataFrame:
+    panel = close_panel(frames)
+    if panel.empty:
+        return pd.DataFrame()
+    latest = pd.DataFrame({name: output.iloc[-1] for name, output in compute_all(panel, SUMMARY_SPECS).items()})
+    last = panel.iloc[-1]
+    # the bar before on the symbol's own calendar, NaN for a symbol with a single bar
+    before = panel.iloc[-2] if len(panel) > 1 else pd.Series(float('nan'), index=panel.columns)
+    band = np.where(last > latest['Bollinger_Band_High'], 'Above', np.where(last < latest['Bollinger_Band_Low'], 'Below', 'Inside'))
+    return pd.DataFrame({
+        'Close': last,
+        'Change %': (last / before - 1) * 100,
+        'Bollinger_Band_High': latest['Bollinger_Band_High'],
+        'Bollinger_Band_Low': latest['Bollinger_Band_Low'],
+        'Bollinger_Band': band,
+        'RSI': latest['RSI'],
+        'MACD': latest['MACD'],
+        'TSI': latest['TSI'],
+        'ROC': latest['ROC'],
+    }, index=panel.columns)
+
+
+# draw the watchlist section, all selected symbols come from a single grouped download
+def render(asset_class: str, default, start_date, end_date):
+    st.markdown('##### Watchlist :eyes:')
+    key = f'{asset_class}_watchlist'
+    if key not in st.session_state:
+        st.session_state[key] = [default]
+    # only the catalog matches and the symbols already picked are sent to the browser
+    query = st.text_input('Find symbols to compare', key=f'{key}_query')
+    options = list(dict.fromkeys(st.session_state[key] + list(catalog.search(query, asset_class))))
+    symbols = st.multiselect('Compare symbols', options, key=key, format_func=catalog.label)
+    if not symbols:
+        st.caption('Pick one or more symbols to compare.')
+        return
+    frames = price_store.download_many(symbols, start=start_date, end=end_date)
+    st.dataframe(summary_table(frames))
@@ -1,28 +1,40 @@
-##########################
+########################
 # portfolio page setup #
-##########################
+########################
+
+# import libraries
+import datetime
 
-#pip install yfinance
-import streamlit as st
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
-import yfinance as yf
-import webbrowser
+import pandas as pd
+import streamlit as st
 from PIL import Image
+from dashboard import catalog, correlation, optimizer, portfolio
+
+# a small ledger across the four asset classes for portfolios that were never saved
+SAMPLE_TRADES = pd.DataFrame({
+    'date': pd.to_datetime(['2024-01-02', '2024-01-02', '2024-01-02', '2024-01-02']),
+    'symbol': ['AAPL', 'BTC-USD', 'EURUSD=X', 'GC=F'],
+    'quantity': [50.0, 0.25, 10000.0, 5.0],
+    'price': [float('nan')] * 4,
+})
 
 ##################
 # Set up sidebar #
 ##################
-# set sidebar title 
+# set sidebar title
 st.sidebar.title('My Portfolio :heavy_dollar_sign:')
-    
-# from PIL import Image 
+
+# from PIL import Image
 image = Image.open('./images/portfolio.jpg')
 st.sidebar.image(image)
 # load stock symbols list
 option = st.sidebar.selectbox('Select Portfolio', ('Schwab','Fidelity','Robinhood','E*TRADE','TD Ameritrade','SoFi','MERRILL','J.P.Morgan'))
-
+starting_cash = st.sidebar.number_input('Starting cash (USD)', 0.0, 1e9, 100000.0, step=1000.0)
+end_date = st.sidebar.date_input('Value up to', datetime.date.today())
+# history the optimizer estimates returns and covariances from
+optimize_start = st.sidebar.date_input('Optimize from', end_date - datetime.timedelta(days=365))
+risk_free = st.sidebar.number_input('Risk free rate %', -5.0, 20.0, 4.0, step=0.25) / 100
 
 # add creator information
 st.sidebar.caption('Presented by Jeff, Thomas and Ray :hotsprings:')
@@ -32,9 +44,102 @@ st.sidebar.caption('Presented by Jeff, Thomas and Ray :hotsprings:')
 ##################
 # setup of the main body window
 st.title('Investment Portfolio')
+st.markdown('Enter the trades of the portfolio below, one row per trade with a negative quantity for a sale. A missing price is filled with the close of the trade date, and every position is valued in US dollars.')
+
+saved = portfolio.load_trades(option)
+trades = st.data_editor(SAMPLE_TRADES if saved is None else saved, num_rows='dynamic', use_container_width=True,
+                        column_config={'date': st.column_config.DateColumn('date'),
+                                       'symbol': st.column_config.TextColumn('symbol'),
+                                       'quantity': st.column_config.NumberColumn('quantity'),
+                                       'price': st.column_config.NumberColumn('price')})
+if st.button('Save trades'):
+    portfolio.save_trades(option, trades)
+    st.success(f'Saved the {option} trades.')
+
+# one engine per portfolio stays in the session, so a rerun with the same ledger only values the bars it has
+# not seen yet; an edited ledger or starting cash replaces it
+key = ('portfolio', option)
+ledger = (pd.util.hash_pandas_object(trades.astype(str)).sum(), starting_cash)
+saved_ledger, engine = st.session_state.get(key, (None, None))
+with st.spinner('Valuing the portfolio...'):
+    if engine is None or saved_ledger != ledger or (len(engine.dates) and engine.dates[-1] > pd.Timestamp(end_date)):
+        engine = portfolio.Portfolio(trades, starting_cash).load(end_date)
+    else:
+        engine.refresh(end_date)
+st.session_state[key] = (ledger, engine)
+if len(engine.skipped):
+    skipped = ', '.join(f'{trade.symbol} on {trade.date.date()}' for trade in engine.skipped.itertuples())
+    st.warning(f'Left out trades with no price and no close to price them at: {skipped}. Enter their price to book them.')
+if len(engine.pending()):
+    st.caption(f'{len(engine.pending())} trades dated after {end_date} are not booked yet.')
+if not len(engine.dates):
+    st.caption('Add a trade to value the portfolio.')
+    st.stop()
 
+nav = engine.nav()
+pnl = engine.pnl()
+col1, col2, col3 = st.columns(3)
+col1.metric('Net Asset Value', f'${nav.iloc[-1]:,.2f}')
+col2.metric('Day P&L', f'${pnl.iloc[-1]:,.2f}', f'{engine.returns().iloc[-1] * 100:.2f}%' if len(nav) > 1 else None)
+col3.metric('Total Return', f'{(nav.iloc[-1] / starting_cash - 1) * 100:.2f}%' if starting_cash else 'n/a')
 
 # add a progress bar
 progress_bar = st.progress(0)
-st.subheader("Future Enhancement - BETA Development")
+st.markdown('##### Net Asset Value')
+st.line_chart(nav)
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Daily P&L')
+st.bar_chart(pnl)
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Exposure by asset class')
+st.area_chart(engine.exposure())
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Holdings')
+holdings = engine.holdings()
+holdings.index = [catalog.label(symbol) for symbol in holdings.index]
+st.dataframe(holdings)
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Efficient frontier')
+symbols = list(engine.holdings().index)
+if len(symbols) < 2 or optimize_start >= end_date:
+    st.caption('The frontier needs at least two holdings and a start date before the valuation date.')
+    st.stop()
+# the covariance, the frontier and the random portfolios are cached, so changing dates back and forth is instant
+with st.spinner('Optimizing...'):
+    mean, cov = optimizer.moments(correlation.returns_panel(symbols, optimize_start, end_date))
+if len(mean) < 2:
+    st.caption('Not enough overlapping price history between the holdings for these dates.')
+    st.stop()
+frontier = optimizer.frontier(mean, cov, risk_free=risk_free)
+cloud = optimizer.random_portfolios(mean, cov, risk_free=risk_free)
+current = engine.values().iloc[-1]
+current = current[current.index.isin(mean.index)]
+current = current / current.sum() if current.sum() else current
+current_return, current_volatility = optimizer.evaluate(current, mean, cov)
+points = {'Current': (current_return, current_volatility)}
+for weights in (frontier.min_variance, frontier.tangency):
+    points[weights.name] = optimizer.evaluate(weights, mean, cov)
+
+fig, ax = plt.subplots(figsize=(10, 6))
+scatter = ax.scatter(cloud['Volatility'] * 100, cloud['Return'] * 100, c=cloud['Sharpe'], cmap='viridis', s=4, alpha=0.5)
+fig.colorbar(scatter, ax=ax, label='Sharpe ratio')
+ax.plot(frontier.volatility * 100, frontier.returns * 100, color='black', label='Efficient frontier')
+for (name, (point_return, point_volatility)), marker in zip(points.items(), ('o', 's', '*')):
+    ax.scatter(point_volatility * 100, point_return * 100, marker=marker, s=150, edgecolors='black', label=name)
+ax.set_xlabel('Volatility % (annualized)')
+ax.set_ylabel('Return % (annualized)')
+ax.legend()
+st.pyplot(fig)
+st.caption(f'Frontier of fully invested portfolios with short sales allowed, {len(cloud):,} random long-only portfolios behind it. Estimated from {optimize_start} to {end_date}.')
 
+weights = pd.DataFrame({'Current': current, 'Minimum variance': frontier.min_variance, 'Maximum Sharpe': frontier.tangency}).fillna(0.0) * 100
+weights.index = [catalog.label(symbol) for symbol in weights.index]
+st.dataframe(weights.rename(columns=lambda name: f'{name} %'))
@@ -0,0 +1,79 @@
+#######################
+# screener page setup #
+#######################
+
+# import libraries
+import datetime
+import os
+
+import pandas as pd
+import streamlit as st
+from dashboard import catalog, columnar, screener
+
+##################
+# Set up sidebar #
+##################
+# set sidebar title
+st.sidebar.title('Technical Screener :mag:')
+# pick the universe to screen
+asset_class = st.sidebar.selectbox('Universe', ('stocks', 'crypto', 'currencies', 'commodities'))
+# one year of history is plenty for the longest window (MACD 26 + 9)
+today = datetime.date.today()
+before = today - datetime.timedelta(days=365)
+start_date = st.sidebar.date_input('Start date', before)
+end_date = st.sidebar.date_input('End date', today)
+if start_date < end_date:
+    st.sidebar.success('Start date: `%s`\n\nEnd date:`%s`' % (start_date, end_date))
+else:
+    st.sidebar.error('Error: End date must fall after start date.')
+# signal settings
+rsi_low, rsi_high = st.sidebar.slider('RSI oversold / overbought', 0, 100, (screener.RSI_OVERSOLD, screener.RSI_OVERBOUGHT))
+min_signals = st.sidebar.slider('Minimum number of signals', 0, 3, 1)
+chunk_size = st.sidebar.number_input('Symbols per worker task', 10, 1000, screener.CHUNK_SIZE, step=10)
+# a columnar snapshot of the universe lets every worker read its closes from one shared memory map
+store_root = os.path.join(columnar.COLUMNAR_DIR, asset_class)
+store = columnar.open_store(store_root)
+use_store = st.sidebar.checkbox('Read from the columnar snapshot', value=store is not None, disabled=store is None)
+if store is not None:
+    if len(store.dates):
+        st.sidebar.caption(f'Snapshot of {len(store.symbols):,} symbols from {store.dates[0].date()} to {store.dates[-1].date()}.')
+if st.sidebar.button('Rebuild snapshot' if store is not None else 'Build snapshot'):
+    with st.spinner('Building the snapshot...'):
+        store = columnar.ColumnarStore.build_from_prices(catalog.symbols(asset_class), start_date, end_date, root=store_root)
+    use_store = True
+# add creator information
+st.sidebar.caption('Presented by Jeff, Thomas and Ray :hotsprings:')
+
+#################
+# Screener body #
+#################
+st.title('Technical Screener')
+st.markdown('Screens every symbol of a universe for RSI extremes, closes outside the Bollinger Bands® and MACD signal line crossovers. Symbols are ranked by the number of signals, then by how far the RSI is from 50.')
+universe = catalog.symbols(asset_class)
+st.caption(f'{len(universe):,} symbols in the {asset_class} universe.')
+
+if st.button('Run screener'):
+    progress = st.progress(0.0)
+    status = st.empty()
+    table = st.empty()
+    results = []
+    failed = []
+    done = 0
+    # every finished chunk is merged, re-ranked and redrawn straight away
+    for chunk, frame, error in screener.screen(universe, start_date, end_date, int(chunk_size), rsi_low, rsi_high, store_root if use_store else None):
+        done += len(chunk)
+        if error is not None:
+            failed.extend(chunk)
+        elif not frame.empty:
+            results.append(frame)
+        progress.progress(done / len(universe))
+        status.caption(f'Screened {done:,} of {len(universe):,} symbols.')
+        if results:
+            ranked = screener.rank(pd.concat(results))
+            ranked = ranked[ranked['Signals'] >= min_signals]
+            ranked.index = [catalog.label(symbol) for symbol in ranked.index]
+            table.dataframe(ranked)
+    if not results:
+        table.caption('No prices were found for this universe and date range.')
+    if failed:
+        st.warning(f'{len(failed):,} symbols could not be screened, they are retried on the next run.')
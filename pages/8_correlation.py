@@ -0,0 +1,104 @@
+##########################
+# correlation page setup #
+##########################
+
+# import libraries
+import datetime
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+from dashboard import catalog, correlation
+
+UNIVERSES = ('crypto', 'stocks', 'currencies', 'commodities')
+
+##################
+# Set up sidebar #
+##################
+# set sidebar title
+st.sidebar.title('Cross-Asset Correlation :link:')
+# pick any mix of universes and how many of the first symbols of each to include
+universes = st.sidebar.multiselect('Universes', UNIVERSES, default=['crypto', 'currencies', 'commodities'])
+per_universe = st.sidebar.slider('Symbols per universe', 2, 1000, 20)
+today = datetime.date.today()
+before = today - datetime.timedelta(days=365)
+start_date = st.sidebar.date_input('Start date', before)
+end_date = st.sidebar.date_input('End date', today)
+if start_date < end_date:
+    st.sidebar.success('Start date: `%s`\n\nEnd date:`%s`' % (start_date, end_date))
+else:
+    st.sidebar.error('Error: End date must fall after start date.')
+method = st.sidebar.radio('Matrix', ('corr', 'cov'), format_func={'corr': 'Correlation', 'cov': 'Covariance'}.get)
+cluster_count = st.sidebar.slider('Clusters', 2, 12, 4)
+# add creator information
+st.sidebar.caption('Presented by Jeff, Thomas and Ray :hotsprings:')
+
+####################
+# Correlation body #
+####################
+st.title('Cross-Asset Correlation')
+if not universes:
+    st.caption('Pick one or more universes in the sidebar.')
+    st.stop()
+# remember which universe every symbol came from
+universe_of = {}
+for universe in universes:
+    for symbol in catalog.symbols(universe)[:per_universe]:
+        universe_of.setdefault(symbol, universe)
+with st.spinner('Loading prices...'):
+    returns = correlation.returns_panel(list(universe_of), start_date, end_date)
+if returns.empty:
+    st.caption('No prices were found for these symbols and dates.')
+    st.stop()
+st.caption(f'{returns.shape[1]:,} symbols, {returns.shape[0]:,} dates. Returns are taken on each symbol\'s own calendar and compared over the dates both symbols traded.')
+
+# the matrix, the symbol order and the clusters all come from the shared cache after the first run
+matrix = correlation.matrix(returns, method)
+corr = matrix if method == 'corr' else correlation.matrix(returns, 'corr')
+order = correlation.spectral_order(corr)
+ordered = matrix.loc[order, order]
+
+# add a progress bar
+progress_bar = st.progress(0)
+st.markdown('##### Heatmap, correlated symbols grouped together')
+fig, ax = plt.subplots(figsize=(10, 8))
+limit = 1.0 if method == 'corr' else max(abs(ordered.min().min()), abs(ordered.max().max()))
+image = ax.imshow(ordered.to_numpy(), cmap='RdBu_r', vmin=-limit, vmax=limit, interpolation='nearest')
+fig.colorbar(image, ax=ax)
+# label the axes only while the labels are still readable
+if len(order) <= 60:
+    ax.set_xticks(range(len(order)))
+    ax.set_xticklabels(order, rotation=90, fontsize=7)
+    ax.set_yticks(range(len(order)))
+    ax.set_yticklabels(order, fontsize=7)
+else:
+    ax.set_xticks([])
+    ax.set_yticks([])
+st.pyplot(fig)
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Clusters')
+labels = correlation.clusters(corr, cluster_count)
+members = pd.DataFrame({
+    'Name': [catalog.label(symbol) for symbol in labels.index],
+    'Universe': [universe_of.get(symbol, '') for symbol in labels.index],
+    'Cluster': labels.to_numpy(),
+}, index=labels.index).sort_values(['Cluster', 'Universe'])
+st.dataframe(members)
+st.dataframe(pd.crosstab(members['Cluster'], members['Universe']))
+
+# add a seperator line
+progress_bar = st.progress(0)
+st.markdown('##### Rolling correlation of a pair')
+col1, col2, col3 = st.columns(3)
+with col1:
+    first = st.selectbox('First symbol', list(returns.columns), format_func=catalog.label)
+with col2:
+    second = st.selectbox('Second symbol', list(returns.columns), index=min(1, returns.shape[1] - 1), format_func=catalog.label)
+with col3:
+    window = st.number_input('Window (days)', 10, 250, 60)
+if first != second:
+    st.line_chart(correlation.rolling_pair(returns, first, second, int(window)))
+else:
+    st.caption('Pick two different symbols.')
@@ -0,0 +1,74 @@
+##########################
+# Indicator engine tests #
+##########################
+
+# import libraries
+import numpy as np
+import pandas as pd
+
+from dashboard import indicators
+
+# five bars, the third one is missing
+HIGH = pd.Series([2.0, 3.0, np.nan, 3.5, 4.0])
+LOW = pd.Series([1.0, 1.5, np.nan, 2.5, 3.0])
+CLOSE = pd.Series([1.5, 2.5, np.nan, 3.0, 3.5])
+
+
+# a missing bar has no true range, the bar after it has no previous close and falls back to high - low
+def test_true_range_keeps_missing_bars_missing():
+    true_range = indicators.IndicatorMixin._true_range(HIGH, LOW, CLOSE.shift(1))
+    np.testing.assert_allclose(true_range.to_numpy(), [1.0, 1.5, np.nan, 1.0, 1.0])
+
+
+# a missing bar must not pull the average true range towards zero
+def test_atr_skips_missing_bars():
+    atr = indicators.AverageTrueRange(HIGH, LOW, CLOSE, window=3).average_true_range()
+    true_range = pd.Series([np.nan, np.nan, (1.0 + 1.5) / 2, 1.0, 1.0])
+    expected = true_range.ewm(alpha=1 / 3, adjust=False).mean()
+    np.testing.assert_allclose(atr.to_numpy(), [np.nan, np.nan, 1.25, expected[3], expected[4]])
+    assert (atr.dropna() > 1.0).all()
+
+
+# panels take the same path as one symbol at a time
+def test_atr_panel_matches_series():
+    panel = indicators.AverageTrueRange(
+        pd.concat({'a': HIGH, 'b': HIGH * 2}, axis=1),
+        pd.concat({'a': LOW, 'b': LOW * 2}, axis=1),
+        pd.concat({'a': CLOSE, 'b': CLOSE * 2}, axis=1),
+        window=3,
+    ).average_true_range()
+    series = indicators.AverageTrueRange(HIGH * 2, LOW * 2, CLOSE * 2, window=3).average_true_range()
+    np.testing.assert_allclose(panel['b'].to_numpy(), series.to_numpy())
+
+
+def test_get_min_max_propagates_nan():
+    output = indicators._get_min_max(pd.Series([1.0, np.nan, 3.0]), pd.Series([2.0, 2.0, np.nan]), 'max')
+    np.testing.assert_allclose(output.to_numpy(), [2.0, np.nan, np.nan])
+
+
+# a symbol that starts trading late in a panel gets the RSI it would get on its own
+def test_rsi_panel_column_starting_late():
+    close = pd.Series(100 + np.cumsum(np.random.default_rng(0).normal(size=60)))
+    late = close.copy()
+    late.iloc[:45] = np.nan
+    panel = indicators.RSIIndicator(pd.concat({'early': close, 'late': late}, axis=1)).rsi()
+    alone = indicators.RSIIndicator(late.dropna()).rsi()
+    np.testing.assert_allclose(panel['late'].iloc[45:].to_numpy(), alone.to_numpy())
+
+
+# a symbol that starts trading late in a panel is seeded at its own first full window of true ranges
+def test_atr_panel_column_starting_late():
+    rng = np.random.default_rng(1)
+    close = pd.Series(100 + np.cumsum(rng.normal(size=200)))
+    high, low = close + rng.uniform(0.5, 1.5, 200), close - rng.uniform(0.5, 1.5, 200)
+    late = close.index < 30
+    panel = indicators.AverageTrueRange(
+        pd.concat({'early': high, 'late': high.mask(late)}, axis=1),
+        pd.concat({'early': low, 'late': low.mask(late)}, axis=1),
+        pd.concat({'early': close, 'late': close.mask(late)}, axis=1),
+    ).average_true_range()
+    alone = indicators.AverageTrueRange(high[~late], low[~late], close[~late]).average_true_range()
+    early = indicators.AverageTrueRange(high, low, close).average_true_range()
+    assert panel['late'].iloc[:30].isna().all()
+    np.testing.assert_allclose(panel['late'].iloc[30:].to_numpy(), alone.to_numpy())
+    np.testing.assert_allclose(panel['early'].to_numpy(), early.to_numpy())
@@ -0,0 +1,56 @@
+##########################
+# Portfolio engine tests #
+##########################
+
+# import libraries
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('yfinance')
+
+from dashboard import portfolio, price_store
+
+# AAPL closes at 100 every day in January 2024, NODATA has no price history at all
+CLOSES = pd.DataFrame({'Close': 100.0}, index=pd.date_range('2024-01-01', '2024-03-31'))
+
+
+@pytest.fixture(autouse=True)
+def closes(monkeypatch):
+    def download_many(symbols, start, end, interval='1d'):
+        return {symbol: price_store._slice(CLOSES, start, end) if symbol == 'AAPL' else pd.DataFrame() for symbol in symbols}
+    monkeypatch.setattr(price_store, 'download_many', download_many)
+
+
+def ledger(*rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=portfolio.TRADE_COLUMNS).assign(date=lambda trades: pd.to_datetime(trades['date']))
+
+
+# a trade dated after the valuation date is not booked until a bar reaches its date
+def test_future_trade_waits_for_its_date():
+    trades = ledger(('2024-01-02', 'AAPL', 10.0, np.nan), ('2024-02-20', 'AAPL', 1000.0, np.nan))
+    engine = portfolio.Portfolio(trades, 100000.0).load('2024-01-31')
+    assert engine.holdings().loc['AAPL', 'Quantity'] == 10
+    assert engine.cash().iloc[-1] == 99000.0
+    assert list(engine.pending()['quantity']) == [1000.0]
+    engine.refresh('2024-02-19')
+    assert engine.holdings().loc['AAPL', 'Quantity'] == 10
+    engine.refresh('2024-02-21')
+    assert engine.holdings().loc['AAPL', 'Quantity'] == 1010
+    assert engine.cash().loc['2024-02-20'] == -1000.0
+    # the same ledger loaded in one go lands on the same numbers
+    loaded = portfolio.Portfolio(trades, 100000.0).load('2024-02-21')
+    pd.testing.assert_series_equal(engine.nav(), loaded.nav(), check_freq=False)
+
+
+# a trade without a price and without a close to price it at is skipped instead of turning the NAV into NaN
+def test_trade_without_any_price_is_skipped():
+    trades = ledger(('2024-01-02', 'AAPL', 10.0, np.nan), ('2024-01-03', 'NODATA', 5.0, np.nan))
+    engine = portfolio.Portfolio(trades, 100000.0).load('2024-01-31')
+    assert list(engine.skipped['symbol']) == ['NODATA']
+    assert not engine.nav().isna().any()
+    assert engine.nav().iloc[-1] == 100000.0
+    # a price given by hand is enough to book it
+    priced = portfolio.Portfolio(ledger(('2024-01-03', 'NODATA', 5.0, 20.0)), 1000.0).load('2024-01-31')
+    assert priced.skipped.empty
+    assert priced.cash().iloc[-1] == 900.0
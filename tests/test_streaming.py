@@ -0,0 +1,49 @@
+#########################
+# Streaming state tests #
+#########################
+
+# import libraries
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import indicators, streaming
+
+# a random walk, and the same walk for a symbol whose first 30 bars are missing
+CLOSE = pd.Series(100 + np.cumsum(np.random.default_rng(0).normal(size=120)))
+LATE = CLOSE.where(CLOSE.index >= 30)
+
+# every streaming class, the batch output it replays and the attribute holding its value
+CASES = [
+    (lambda: streaming.StreamingEMA(span=12, min_periods=12), lambda close: close.ewm(span=12, min_periods=12, adjust=False).mean(), 'value'),
+    (streaming.StreamingBollinger, lambda close: indicators.BollingerBands(close).bollinger_hband(), 'hband'),
+    (streaming.StreamingBollinger, lambda close: indicators.BollingerBands(close).bollinger_lband(), 'lband'),
+    (streaming.StreamingRSI, lambda close: indicators.RSIIndicator(close).rsi(), 'value'),
+    (streaming.StreamingMACD, lambda close: indicators.MACD(close).macd(), 'macd'),
+    (streaming.StreamingMACD, lambda close: indicators.MACD(close).macd_signal(), 'macd_signal'),
+    (streaming.StreamingTSI, lambda close: indicators.TSIIndicator(close).tsi(), 'value'),
+    (streaming.StreamingROC, lambda close: indicators.ROCIndicator(close).roc(), 'value'),
+]
+
+
+# one bar at a time gives the batch output on every bar, with and without leading missing bars
+@pytest.mark.parametrize('close', [CLOSE, LATE], ids=['full', 'leading_nan'])
+@pytest.mark.parametrize('make, batch, attribute', CASES)
+def test_streaming_matches_batch(close, make, batch, attribute):
+    indicator = make()
+    values = []
+    for price in close:
+        indicator.update(float(price))
+        values.append(getattr(indicator, attribute))
+    np.testing.assert_allclose(values, batch(close).to_numpy(), rtol=1e-9, atol=1e-9)
+
+
+# the set the intraday feed keeps previews a forming bar without taking it into its state
+def test_streaming_set_preview():
+    stream = streaming.StreamingSet()
+    stream.seed(LATE.iloc[:-1])
+    before = stream.values()
+    expected = indicators.compute_all(LATE)
+    for name, value in stream.preview(float(LATE.iloc[-1])).items():
+        np.testing.assert_allclose(value, expected[name].iloc[-1], rtol=1e-9)
+    np.testing.assert_equal(stream.values(), before)